@@ -15,26 +15,25 @@
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-import copy
+import inspect
 import math
+import os
 import random
 import sys
-import qrcode
 import gettext
+import tempfile
 
-from functools import wraps
-from typing import Any, Callable
+from functools import lru_cache, wraps
+from itertools import cycle, zip_longest
+from typing import Any, Callable, Sequence
 from argparse import ArgumentParser
 from contextlib import contextmanager
 from xml.sax.saxutils import quoteattr
-from shapely.geometry import Polygon, Point, LineString
-from shapely.ops import split
 
-from boxes import edges, formats, gears, parts, pulley, svgutil
+from boxes import edges, formats
 from boxes.Color import Color
 from boxes.vectors import kerf
-from boxes.qrcode_factory import BoxesQrCodeFactory
-from boxes.utils import dist, argparseSections
+from boxes.utils import argparseSections
 
 ### Helpers
 
@@ -82,6 +81,215 @@ def holeCol(func: Callable):
     return f
 
 
+@lru_cache(maxsize=1024)
+def _tabbedCorner(degrees, radius, burn, tab_len, tabs):
+    """Plan the sub arcs of a corner interrupted by tabs
+
+    :param degrees: angle of the corner
+    :param radius: radius of the corner
+    :param burn: burn correction
+    :param tab_len: length of a single tab
+    :param tabs: maximum number of tabs
+    :return: (tabs, angle of the arcs, angle of the tabs, radius of the tabs)
+             or None if there is no room for tabs
+    """
+    rad = degrees * math.pi / 180
+    if degrees > 0:
+        r_ = radius + burn
+        tabrad = tab_len / max(r_, 0.01)
+    else:
+        r_ = radius - burn
+        tabrad = -tab_len / max(r_, 0.01)
+
+    length = abs(r_ * rad)
+    tabs = min(tabs, int(length // (tabs * 3 * tab_len)))
+    if not tabs:
+        return None
+    square = (length - tabs * tab_len) / tabs
+    lang = math.degrees(square / r_)
+    if degrees < 0:
+        lang = -lang
+    return tabs, lang, math.degrees(tabrad), r_
+
+
+# Trigonometry of angles in degrees. The same handful of angles (corners
+# of regular polygons, edge corners) get used over and over again.
+
+
+@lru_cache(maxsize=1024)
+def _sin_deg(degrees):
+    return math.sin(math.radians(degrees))
+
+
+@lru_cache(maxsize=1024)
+def _cos_deg(degrees):
+    return math.cos(math.radians(degrees))
+
+
+@lru_cache(maxsize=1024)
+def _tan_deg(degrees):
+    return math.tan(math.radians(degrees))
+
+
+@lru_cache(maxsize=None)
+def _interior_tan(corners):
+    """tan of half the interior angle of a regular polygon"""
+    return math.tan(math.radians(90 - 180.0 / corners))
+
+
+def _renderVariant(cls, params):
+    """Render one variant for Boxes.render_batch() in a worker process
+
+    Needs to live on module level to be usable with a process pool.
+
+    :param cls: Boxes sub class to render
+    :param params: dict of parameters
+    :return: content of the output file
+    """
+    params = dict(params)
+    accepted = inspect.signature(cls.__init__).parameters
+    ctor_params = {k: params.pop(k) for k in list(params) if k in accepted}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        box = cls(**ctor_params)
+        box.parseArgs([])
+        known = {action.dest for action in box.argparser._actions}
+        for name, value in params.items():
+            if name not in known:
+                raise ValueError(f"Unknown parameter for {cls.__name__}: {name}")
+            # route edge settings like .parseArgs() does
+            for setting in box.edgesettings:
+                if name.startswith(setting + "_"):
+                    box.edgesettings[setting][name[len(setting) + 1 :]] = value
+            setattr(box, name, value)
+        if "output" not in ctor_params and "output" not in params:
+            box.output = os.path.join(tmpdir, "box." + box.format.split("_")[0])
+        box.open()
+        box.render()
+        box.close()
+        with open(box.output, "rb") as f:
+            return f.read()
+
+
+_TAN30 = math.tan(math.radians(30))
+_COS30 = math.cos(math.pi / 6.0)
+_HALF_PI = 0.5 * math.pi
+
+
+@lru_cache(maxsize=16)
+def _regularPolygonParams(n):
+    """Factors of a regular polygon with n corners independent of its size
+
+    :param n: number of corners
+    :return: (sin of half the center angle, 1 - cos of center angle,
+              ratio of missing side length to corner chord,
+              outer angle, heading of the first side)
+    """
+    return (
+        math.sin(math.pi / n),
+        1 - math.cos(2 * math.pi / n),
+        math.sin(math.pi / n) / math.sin(2 * math.pi / n),
+        360 / n,
+        90 + 180 / n,
+    )
+
+
+def _polygonEdges(poly):
+    """All edges of a (multi) polygon including those of its holes
+
+    :param poly: shapely Polygon or MultiPolygon
+    :return: list of (x1, y1, x2, y2) tuples
+    """
+    edges = []
+    if poly.is_empty:
+        return edges
+    for geom in getattr(poly, "geoms", (poly,)):
+        for ring in (geom.exterior, *geom.interiors):
+            coords = ring.coords
+            edges.extend((x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(coords, coords[1:]))
+    return edges
+
+
+def _scanline(edges, y):
+    """Intervals of the horizontal line at y that lie within a polygon
+
+    :param edges: edges of the polygon as returned by _polygonEdges()
+    :param y: height of the line
+    :return: sorted list of (x_start, x_end) tuples
+    """
+    xs = sorted(
+        x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        for x1, y1, x2, y2 in edges
+        if (y1 > y) != (y2 > y)
+    )
+    return list(zip(xs[::2], xs[1::2]))
+
+
+_TEXT_MOVES = {
+    "top": -1.0,
+    "middle": -0.5,
+    "bottom": 0.0,
+    "left": "left",
+    "center": "middle",
+    "right": "end",
+}
+
+
+@lru_cache(maxsize=64)
+def _parseAlign(align):
+    """Parse the align parameter of Boxes.text()
+
+    :param align: string with combinations of (top|middle|bottom) and (left|center|right)
+    :return: (horizontal alignment, tuple of vertical moves as factors of the text height)
+    """
+    halign = "left"
+    vmoves = []
+    for a in align.split():
+        if a not in _TEXT_MOVES:
+            raise ValueError("Unknown alignment: %s" % align.split())
+        if isinstance(_TEXT_MOVES[a], str):
+            halign = _TEXT_MOVES[a]
+        else:
+            vmoves.append(_TEXT_MOVES[a])
+    return halign, tuple(vmoves)
+
+
+_MOVE_TERMS = frozenset(("up", "down", "left", "right", "only", "mirror", "rotated"))
+# directions that are moved before the part is drawn
+_MOVE_BEFORE_PRINT = frozenset(("down", "left"))
+# edges that only draw their outline (without bed bolts) and can
+# therefore be recorded and replayed with Context.add_shape()
+_REPLAYABLE_EDGES = frozenset(
+    (
+        edges.Edge,
+        edges.OutSetEdge,
+        edges.FingerJointEdge,
+        edges.FingerJointEdgeCounterPart,
+    )
+)
+
+
+@lru_cache(maxsize=64)
+def _parseMove(where):
+    """Parse the where parameter of Boxes.move()
+
+    :param where: string with combinations of the move terms
+    :return: (terms to move before drawing, terms to move after drawing,
+              "only" in terms, "mirror" in terms, "rotated" in terms)
+    """
+    terms = tuple(where.split())
+    for term in terms:
+        if term not in _MOVE_TERMS:
+            raise ValueError("Unknown direction: '%s'" % term)
+    only = "only" in terms
+    if only:
+        # part is not drawn - do the whole move up front
+        before_terms = terms
+    else:
+        before_terms = tuple(t for t in terms if t in _MOVE_BEFORE_PRINT)
+    after_terms = tuple(t for t in terms if t not in _MOVE_BEFORE_PRINT)
+    return before_terms, after_terms, only, "mirror" in terms, "rotated" in terms
+
+
 #############################################################################
 ### Building blocks
 #############################################################################
@@ -112,25 +320,34 @@ class NutHole:
         "M56": (85, 45),
         "M64": (95, 51),
     }
+    # width across flats and side length of the hexagon for each size
+    _hexagons = {name: (s[0], s[0] / 3**0.5) for name, s in sizes.items()}
 
     def __init__(self, boxes, settings) -> None:
         self.boxes = boxes
         self.ctx = boxes.ctx
         self.settings = settings
-
-    def __getattr__(self, name):
-        return getattr(self.boxes, name)
+        # Bind what is needed for drawing (incl. by the decorators)
+        self.saved_context = boxes.saved_context
+        self.set_source_color = boxes.set_source_color
+        self.moveTo = boxes.moveTo
+        self.edge = boxes.edge
+        self.corner = boxes.corner
 
     @restore
     @holeCol
     def __call__(self, size, x=0, y=0, angle=0):
-        size = self.sizes.get(size, (size,))[0]
-        side = size / 3**0.5
-        self.boxes.moveTo(x, y, angle)
-        self.boxes.moveTo(-0.5 * side, 0.5 * size, angle)
+        hexagon = self._hexagons.get(size)
+        if hexagon:
+            size, side = hexagon
+        else:
+            side = size / 3**0.5
+        edge, corner = self.edge, self.corner
+        self.moveTo(x, y, angle)
+        self.moveTo(-0.5 * side, 0.5 * size, angle)
         for i in range(6):
-            self.boxes.edge(side)
-            self.boxes.corner(-60)
+            edge(side)
+            corner(-60)
 
 
 ##############################################################################
@@ -280,6 +497,7 @@ class Boxes:
         reference: float = 100,
         inner_corners: str = "loop",
         burn: float = 0.1,
+        optimize_travel: bool = True,
     ) -> None:
         self.thickness = thickness
         self.output = output
@@ -291,9 +509,11 @@ class Boxes:
         self.reference = reference
         self.inner_corners = inner_corners
         self.burn = burn
+        self.optimize_travel = optimize_travel
 
         self.formats = formats.Formats()
         self.ctx = None
+        self._onlyMoveSize = None  # see .partsMatrix()
         description: str = self.__doc__ or ""
         if self.description:
             description += "\n\n" + self.description
@@ -317,7 +537,14 @@ class Boxes:
         self.thickness: float = thickness
 
         self.argparser._action_groups[1].title = self.__class__.__name__ + " Settings"
-        self.argparser.add_argument_group("Default Settings")
+        defaultgroup = self.argparser.add_argument_group("Default Settings")
+        defaultgroup.add_argument(
+            "--optimize_travel",
+            action="store",
+            type=boolarg,
+            default=optimize_travel,
+            help="reorder the parts to shorten the travel between them",
+        )
 
     @contextmanager
     def saved_context(self):
@@ -331,14 +558,14 @@ class Boxes:
         finally:
             cr.restore()
 
-    def set_source_color(self, color: Color) -> None:
+    def set_source_color(self, color: Sequence[float]) -> None:
         """Sets the color of the pen.
 
         Args:
-            color (Color): The color to use
+            color (Sequence[float]): The color to use, e.g. Color.BLACK
         """
 
-        self.ctx.set_source_rgb(*color)
+        self.ctx.set_source_rgb(color[0], color[1], color[2])
 
     def set_font(self, style: str, bold=False, italic=False):
         """Set font style used
@@ -678,6 +905,8 @@ class Boxes:
 
         # Nuts
         self.addPart(NutHole(self, None))
+        from boxes import gears, parts, pulley
+
         # Gears
         self.addPart(gears.Gears(self))
         s = edges.GearSettings(
@@ -687,10 +916,28 @@ class Boxes:
         self.addPart(pulley.Pulley(self))
         self.addPart(parts.Parts(self))
 
+    def _resolve_edge(self, edge):
+        """Char to edge object - anything else is passed through
+
+        :param edge: edge char or edge object
+        """
+        if isinstance(edge, str):
+            return self.edges.get(edge, edge)
+        return edge
+
+    def _resolve_edges(self, edges):
+        """Chars to edge objects - anything else is passed through
+
+        :param edges: iterable of edge chars or edge objects
+        :return: list of edge objects
+        """
+        get = self.edges.get
+        return [get(e, e) if isinstance(e, str) else e for e in edges]
+
     def adjustSize(self, square, e1=True, e2=True):
         # Char to edge object
-        e1 = self.edges.get(e1, e1)
-        e2 = self.edges.get(e2, e2)
+        e1 = self._resolve_edge(e1)
+        e2 = self._resolve_edge(e2)
 
         try:
             total = sum(square)
@@ -726,6 +973,25 @@ class Boxes:
         # Change settings and create new Edges and part classes here
         raise NotImplementedError
 
+    @classmethod
+    def render_batch(cls, variants, workers=None):
+        """Render several variants of this generator in parallel
+
+        Each variant is rendered in its own process. This requires
+        .render() to not depend on anything but the parameters.
+
+        :param variants: list of dicts with parameters. Parameters of the
+            constructor are passed to it, all others need to be command line
+            arguments (like FingerJoint_finger) and are set after parsing the
+            (default) arguments. Raises ValueError for unknown parameters.
+        :param workers:  (Default value = None) number of processes, None for one per CPU
+        :return: list of the contents of the output files
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return list(pool.map(_renderVariant, [cls] * len(variants), variants))
+
     def cc(self, callback, number, x=0.0, y=None, a=0.0):
         """Call callback from edge of a part
 
@@ -782,6 +1048,8 @@ class Boxes:
         self.surface.set_metadata(self.metadata)
 
         self.surface.flush()
+        if self.optimize_travel:
+            self.surface.reorder_parts()
         self.surface.finish(self.inner_corners)
 
         self.formats.convert(self.output, self.format, self.metadata)
@@ -790,6 +1058,8 @@ class Boxes:
                 out = sys.stdout.buffer
             except AttributeError:
                 out = sys.stdout
+            from boxes import svgutil
+
             svgutil.svgMerge(self.output, self.inkscapefile, out)
 
     ############################################################
@@ -806,96 +1076,75 @@ class Boxes:
         :param radius:  (Default value = 0)
         """
 
-        try:
-            degrees, radius = degrees
-        except Exception:
-            pass
+        if not isinstance(degrees, (int, float)):
+            try:
+                degrees, radius = degrees
+            except Exception:
+                pass
 
         rad = degrees * math.pi / 180
 
         if tabs and self.tabs:
-            if degrees > 0:
-                r_ = radius + self.burn
-                tabrad = self.tabs / max(r_, 0.01)
-            else:
-                r_ = radius - self.burn
-                tabrad = -self.tabs / max(r_, 0.01)
-
-            length = abs(r_ * rad)
-            tabs = min(tabs, int(length // (tabs * 3 * self.tabs)))
-        if tabs and self.tabs:
-            square = (length - tabs * self.tabs) / tabs
-            lang = math.degrees(square / r_)
-            if degrees < 0:
-                lang = -lang
-            # print(degrees, radius, l, lang, tabs, math.degrees(tabrad))
-            self.corner(lang / 2.0, radius)
-            for i in range(tabs - 1):
-                self.moveArc(math.degrees(tabrad), r_)
-                self.corner(lang, radius)
-            if tabs:
-                self.moveArc(math.degrees(tabrad), r_)
-            self.corner(lang / 2.0, radius)
-            return
+            plan = _tabbedCorner(degrees, radius, self.burn, self.tabs, tabs)
+            if plan:
+                tabs, lang, tabangle, r_ = plan
+                self.corner(lang / 2.0, radius)
+                for i in range(tabs - 1):
+                    self.moveArc(tabangle, r_)
+                    self.corner(lang, radius)
+                self.moveArc(tabangle, r_)
+                self.corner(lang / 2.0, radius)
+                return
 
+        # split large arcs into several smaller ones
+        steps = 1
         if (radius > 0.5 * self.burn and abs(degrees) > 36) or (abs(degrees) > 100):
             steps = int(abs(degrees) / 36.0) + 1
-            for i in range(steps):
-                self.corner(float(degrees) / steps, radius)
-            return
+            degrees = float(degrees) / steps
+            rad = degrees * math.pi / 180
 
+        burn = self.burn
         if degrees > 0:
-            self.ctx.arc(
-                0,
-                radius + self.burn,
-                radius + self.burn,
-                -0.5 * math.pi,
-                rad - 0.5 * math.pi,
-            )
-        elif radius > self.burn:
-            self.ctx.arc_negative(
-                0,
-                -(radius - self.burn),
-                radius - self.burn,
-                0.5 * math.pi,
-                rad + 0.5 * math.pi,
-            )
+            arc, yc, r = self.ctx.arc, radius + burn, radius + burn
+            angle1, angle2 = -_HALF_PI, rad - _HALF_PI
+        elif radius > burn:
+            arc, yc, r = self.ctx.arc_negative, -(radius - burn), radius - burn
+            angle1, angle2 = _HALF_PI, rad + _HALF_PI
         else:  # not rounded inner corner
-            self.ctx.arc_negative(
-                0,
-                self.burn - radius,
-                self.burn - radius,
-                -0.5 * math.pi,
-                -0.5 * math.pi + rad,
-            )
-
-        self._continueDirection(rad)
+            arc, yc, r = self.ctx.arc_negative, burn - radius, burn - radius
+            angle1, angle2 = -_HALF_PI, -_HALF_PI + rad
+        continueDirection = self._continueDirection
+        for i in range(steps):
+            arc(0, yc, r, angle1, angle2)
+            continueDirection(rad)
 
     def edge(self, length, tabs=0):
         """
         Simple line
         :param length: length in mm
         """
-        self.ctx.move_to(0, 0)
+        ctx = self.ctx
+        ctx.move_to(0, 0)
         if tabs and self.tabs:
             if self.tabs > length:
-                self.ctx.move_to(length, 0)
+                ctx.move_to(length, 0)
             else:
                 tabs = min(tabs, max(1, int(length // (tabs * 3 * self.tabs))))
                 square = (length - tabs * self.tabs) / tabs
-                self.ctx.line_to(0.5 * square, 0)
+                ctx.line_to(0.5 * square, 0)
                 for i in range(tabs - 1):
-                    self.ctx.move_to((i + 0.5) * square + self.tabs, 0)
-                    self.ctx.line_to((i + 0.5) * square + self.tabs + square, 0)
+                    ctx.move_to((i + 0.5) * square + self.tabs, 0)
+                    ctx.line_to((i + 0.5) * square + self.tabs + square, 0)
                 if tabs == 1:
-                    self.ctx.move_to((tabs - 0.5) * square + self.tabs, 0)
+                    ctx.move_to((tabs - 0.5) * square + self.tabs, 0)
                 else:
-                    self.ctx.move_to((tabs - 0.5) * square + 2 * self.tabs, 0)
+                    ctx.move_to((tabs - 0.5) * square + 2 * self.tabs, 0)
 
-                self.ctx.line_to(length, 0)
+                ctx.line_to(length, 0)
         else:
-            self.ctx.line_to(length, 0)
-        self.ctx.translate(*self.ctx.get_current_point())
+            ctx.line_to(length, 0)
+        # all branches end at (length, 0)
+        ctx.translate(length, 0)
 
     def step(self, out):
         """
@@ -924,8 +1173,11 @@ class Boxes:
         self.ctx.curve_to(x1, y1, x2, y2, x3, y3)
         dx = x3 - x2
         dy = y3 - y2
-        rad = math.atan2(dy, dx)
-        self._continueDirection(rad)
+        if dy == 0 and dx >= 0:
+            # still heading in x direction (or no direction at all)
+            self._continueDirection()
+        else:
+            self._continueDirection(math.atan2(dy, dx))
 
     def polyline(self, *args):
         """
@@ -936,17 +1188,25 @@ class Boxes:
         lengths may be a tuple (length, #tabs)
         angles may be tuple (angle, radius)
         """
-        for i, arg in enumerate(args):
-            if i % 2:
-                if isinstance(arg, tuple):
-                    self.corner(*arg)
-                else:
-                    self.corner(arg)
+        self._polyline(args)
+
+    def _polyline(self, args):
+        """Same as .polyline() but takes the arguments as one sequence
+
+        :param args: sequence of alternating lengths and angles
+        """
+        edge, corner = self.edge, self.corner
+        for length, angle in zip_longest(args[::2], args[1::2]):
+            if isinstance(length, tuple):
+                edge(*length)
             else:
-                if isinstance(arg, tuple):
-                    self.edge(*arg)
-                else:
-                    self.edge(arg)
+                edge(length)
+            if angle is None:  # odd number of args
+                break
+            if isinstance(angle, tuple):
+                corner(*angle)
+            else:
+                corner(angle)
 
     def bedBoltHole(self, length, bedBoltSettings=None, tabs=0):
         """
@@ -984,12 +1244,13 @@ class Boxes:
 
     def edgeCorner(self, edge1, edge2, angle=90):
         """Make a corner between two Edges. Take width of edges into account"""
-        edge1 = self.edges.get(edge1, edge1)
-        edge2 = self.edges.get(edge2, edge2)
+        edge1 = self._resolve_edge(edge1)
+        edge2 = self._resolve_edge(edge2)
 
-        self.edge(edge2.startwidth() * math.tan(math.radians(angle / 2.0)))
+        t = _tan_deg(angle / 2.0)
+        self.edge(edge2.startwidth() * t)
         self.corner(angle)
-        self.edge(edge1.endwidth() * math.tan(math.radians(angle / 2.0)))
+        self.edge(edge1.endwidth() * t)
 
     def regularPolygon(self, corners=3, radius=None, h=None, side=None):
         """Give measures of a regular polygon
@@ -1001,14 +1262,14 @@ class Boxes:
         :return: (radius, h, side)
         """
         if radius:
-            side = 2 * math.sin(math.radians(180.0 / corners)) * radius
-            h = radius * math.cos(math.radians(180.0 / corners))
+            side = 2 * _sin_deg(180.0 / corners) * radius
+            h = radius * _cos_deg(180.0 / corners)
         elif h:
-            side = 2 * math.tan(math.radians(180.0 / corners)) * h
-            radius = ((side / 2.0) ** 2 + h**2) ** 0.5
+            side = 2 * _tan_deg(180.0 / corners) * h
+            radius = math.hypot(side / 2.0, h)
         elif side:
-            h = 0.5 * side * math.tan(math.radians(90 - 180.0 / corners))
-            radius = ((side / 2.0) ** 2 + h**2) ** 0.5
+            h = 0.5 * side * _interior_tan(corners)
+            radius = math.hypot(side / 2.0, h)
 
         return radius, h, side
 
@@ -1048,39 +1309,31 @@ class Boxes:
 
         if not hasattr(edges, "__getitem__") or len(edges) == 1:
             edges = [edges] * corners
-        edges = [self.edges.get(e, e) for e in edges]
+        edges = self._resolve_edges(edges)
         edges += edges  # append for wrapping around
 
+        spacings = [e.spacing() for e in edges[: corners + 1]]
+        # stretch of the edge spacing at the corners
+        stretch = _sin_deg(90 - 180 / corners)
+
         if corners % 2:
             th = (
                 r
                 + h
-                + edges[0].spacing()
-                + (
-                    max(
-                        edges[corners // 2].spacing(), edges[corners // 2 + 1].spacing()
-                    )
-                    / math.sin(math.radians(90 - 180 / corners))
-                )
+                + spacings[0]
+                + max(spacings[corners // 2], spacings[corners // 2 + 1]) / stretch
             )
         else:
-            th = 2 * h + edges[0].spacing() + edges[corners // 2].spacing()
+            th = 2 * h + spacings[0] + spacings[corners // 2]
 
-        tw = 0
-        for i in range(corners):
-            ang = (180 + 360 * i) / corners
-            tw = max(
-                tw,
-                2
-                * abs(
-                    math.sin(math.radians(ang))
-                    * (
-                        r
-                        + max(edges[i].spacing(), edges[i + 1].spacing())
-                        / math.sin(math.radians(90 - 180 / corners))
-                    )
-                ),
+        tw = max(
+            2
+            * abs(
+                _sin_deg((180 + 360 * i) / corners)
+                * (r + max(spacings[i], spacings[i + 1]) / stretch)
             )
+            for i in range(corners)
+        )
 
         if self.move(tw, th, move, before=True):
             return
@@ -1201,7 +1454,6 @@ class Boxes:
         :param y:  (Default value = 0.0)
         :param degrees:  (Default value = 0)
         """
-        self.ctx.move_to(0, 0)
         self.ctx.translate(x, y)
         self.ctx.rotate(degrees * math.pi / 180.0)
         self.ctx.move_to(0, 0)
@@ -1245,27 +1497,22 @@ class Boxes:
         :param where: which direction to move
         :param before:  (Default value = False) called before or after part being drawn
         """
-        if not where:
-            where = ""
-
-        terms = where.split()
-        dontdraw = before and "only" in terms
+        before_terms, after_terms, only, mirror, rotated = _parseMove(where or "")
+        dontdraw = before and only
 
         x += self.spacing
         y += self.spacing
 
-        if "rotated" in terms:
+        if rotated:
             x, y = y, x
 
-        moves = {
-            "up": (0, y, False),
-            "down": (0, -y, True),
-            "left": (-x, 0, True),
-            "right": (x, 0, False),
-            "only": (0, 0, None),
-            "mirror": (0, 0, None),
-            "rotated": (0, 0, None),
-        }
+        if dontdraw:
+            # let .partsMatrix() know how far a part moves - False if
+            # the part is made of several moves
+            if self._onlyMoveSize is None:
+                self._onlyMoveSize = (x, y)
+            else:
+                self._onlyMoveSize = False
 
         if not before:
             # restore position
@@ -1281,14 +1528,17 @@ class Boxes:
                 )
             self.ctx.stroke()
 
-        for term in terms:
-            if term not in moves:
-                raise ValueError("Unknown direction: '%s'" % term)
-            mx, my, movebeforeprint = moves[term]
-            if movebeforeprint and before:
-                self.moveTo(mx, my)
-            elif (not movebeforeprint and not before) or dontdraw:
-                self.moveTo(mx, my)
+        for term in before_terms if before else after_terms:
+            if term == "up":
+                self.moveTo(0, y)
+            elif term == "down":
+                self.moveTo(0, -y)
+            elif term == "left":
+                self.moveTo(-x, 0)
+            elif term == "right":
+                self.moveTo(x, 0)
+            else:
+                self.moveTo(0, 0)
         if not dontdraw:
             if before:
                 # paint debug rectangle
@@ -1298,10 +1548,10 @@ class Boxes:
                         self.ctx.rectangle(0, 0, x, y)
                 # save position
                 self.ctx.save()
-                if "rotated" in terms:
+                if rotated:
                     self.moveTo(x, 0, 90)
                     x, y = y, x  # change back for "mirror"
-                if "mirror" in terms:
+                if mirror:
                     self.moveTo(x, 0)
                     self.ctx.scale(-1, 1)
                 self.moveTo(self.spacing / 2.0, self.spacing / 2.0)
@@ -1320,12 +1570,7 @@ class Boxes:
         """
         r += self.burn
         self.moveTo(x + r, y)
-        a = 0
-        n = 10
-        da = 2 * math.pi / n
-        for i in range(n):
-            self.ctx.arc(-r, 0, r, a, a + da)
-            a += da
+        self.ctx.arc(-r, 0, r, 0, 2 * math.pi)
         self.ctx.stroke()
 
     @restore
@@ -1358,20 +1603,27 @@ class Boxes:
             corner_radius = self.burn
         cr_ = corner_radius - self.burn
 
-        side_length = 2 * r_ * math.sin(math.pi / n)
-        # the corner chord:
-        s = math.sqrt(2 * math.pow(cr_, 2) * (1 - math.cos(2 * math.pi / n)))
-        # the missing portion of the rounded corner:
-        b = math.sin(math.pi / n) / math.sin(2 * math.pi / n) * s
-        # the flat portion of the side:
-        flat_side_length = side_length - 2 * b
+        # only called the first time a hole of this shape is drawn
+        def draw():
+            sin_half, one_minus_cos, b_ratio, angle, heading = _regularPolygonParams(n)
+            side_length = 2 * r_ * sin_half
+            # the corner chord:
+            s = math.sqrt(2 * math.pow(cr_, 2) * one_minus_cos)
+            # the missing portion of the rounded corner:
+            b = b_ratio * s
+            # the flat portion of the side:
+            flat_side_length = side_length - 2 * b
+
+            self.moveTo(r_, 0, heading)
+            self.moveTo(b, 0, 0)
+            for _ in range(n):
+                self.edge(flat_side_length)
+                self.corner(angle, cr_)
 
         self.moveTo(x, y, a)
-        self.moveTo(r_, 0, 90 + 180 / n)
-        self.moveTo(b, 0, 0)
-        for _ in range(n):
-            self.edge(flat_side_length)
-            self.corner(360 / n, cr_)
+        self.ctx.add_shape(
+            ("regularPolygon", n, r, corner_radius, self.burn), draw
+        )
 
     @restore
     @holeCol
@@ -1383,14 +1635,34 @@ class Boxes:
         :param y: position
         :param r: radius
         """
+        self._hole(x, y, r, d, tabs)
+
+    @restore
+    @holeCol
+    def holes(self, coords, r=0.0, d=0.0, tabs=0):
+        """
+        Draw several round holes of the same size
+
+        :param coords: (x, y) positions of the holes
+        :param r: radius
+        """
+        for x, y in coords:
+            with self.saved_context():
+                self._hole(x, y, r, d, tabs)
+                self.ctx.stroke()
 
+    def _hole(self, x, y, r=0.0, d=0.0, tabs=0):
         if not r:
             r = d / 2.0
         if r < self.burn:
             r = self.burn + 1e-9
         r_ = r - self.burn
         self.moveTo(x + r_, y, -90)
-        self.corner(-360, r, tabs)
+        # corner() takes the tab length from self.tabs
+        self.ctx.add_shape(
+            ("hole", r, self.burn, tabs, self.tabs if tabs else 0),
+            lambda: self.corner(-360, r, tabs),
+        )
 
     @restore
     @holeCol
@@ -1406,6 +1678,27 @@ class Boxes:
         :param center_x:  (Default value = True) if True, x position is the center, else the start
         :param center_y:  (Default value = True) if True, y position is the center, else the start
         """
+        self._rectangularHole(x, y, dx, dy, r, center_x, center_y)
+
+    @restore
+    @holeCol
+    def rectangularHoles(self, coords, dx, dy, r=0, center_x=True, center_y=True):
+        """
+        Draw several rectangular holes of the same size
+
+        :param coords: (x, y) positions of the holes
+        :param dx: width
+        :param dy: height
+        :param r:  (Default value = 0) radius of the corners
+        :param center_x:  (Default value = True) if True, x position is the center, else the start
+        :param center_y:  (Default value = True) if True, y position is the center, else the start
+        """
+        for x, y in coords:
+            with self.saved_context():
+                self._rectangularHole(x, y, dx, dy, r, center_x, center_y)
+                self.ctx.stroke()
+
+    def _rectangularHole(self, x, y, dx, dy, r=0, center_x=True, center_y=True):
         r = min(r, dx / 2.0, dy / 2.0)
         x_start = x if center_x else x + dx / 2.0
         y_start = y - dy / 2.0 if center_y else y
@@ -1447,7 +1740,8 @@ class Boxes:
         self.moveTo(r - self.burn, 0, -90)
         self.corner(-360 + 2 * a, r)
         self.corner(-a)
-        self.edge(2 * r * math.sin(math.radians(a)))
+        # 2 * r * sin(acos(w / r))
+        self.edge(2.0 * math.sqrt(r * r - w * w))
 
     @restore
     @holeCol
@@ -1479,10 +1773,12 @@ class Boxes:
         a = math.degrees(math.acos(w / r))
         self.moveTo(x, y, angle - a)
         self.moveTo(r - self.burn, 0, -90)
+        # 2 * r * sin(acos(w / r))
+        chord = 2.0 * math.sqrt(r * r - w * w)
         for i in range(2):
             self.corner(-180 + 2 * a, r)
             self.corner(-a)
-            self.edge(2 * r * math.sin(math.radians(a)))
+            self.edge(chord)
             self.corner(-a)
 
     @restore
@@ -1544,28 +1840,15 @@ class Boxes:
 
         lines = len(text)
         height = lines * fontsize + (lines - 1) * 0.4 * fontsize
-        align = align.split()
-        halign = "left"
-        moves = {
-            "top": -height,
-            "middle": -0.5 * height,
-            "bottom": 0,
-            "left": "left",
-            "center": "middle",
-            "right": "end",
-        }
-        for a in align:
-            if a in moves:
-                if isinstance(moves[a], str):
-                    halign = moves[a]
-                else:
-                    self.moveTo(0, moves[a])
-            else:
-                raise ValueError("Unknown alignment: %s" % align)
+        halign, vmoves = _parseAlign(align)
+        for f in vmoves:
+            self.moveTo(0, f * height)
 
+        show_text = self.ctx.show_text
+        line_skip = 1.4 * fontsize
         for line in reversed(text):
-            self.ctx.show_text(line, fs=fontsize, align=halign, rgb=color, font=font)
-            self.moveTo(0, 1.4 * fontsize)
+            show_text(line, fs=fontsize, align=halign, rgb=color, font=font)
+            self.moveTo(0, line_skip)
 
     tx_sizes = {
         1: 0.61,
@@ -1606,7 +1889,7 @@ class Boxes:
         self.moveTo(x, y, angle)
 
         size = self.tx_sizes.get(size, 0)
-        ri = 0.5 * size * math.tan(math.radians(30))
+        ri = 0.5 * size * _TAN30
         ro = ri * (2**0.5 - 1)
 
         self.moveTo(size * 0.5 - self.burn, 0, -90)
@@ -1645,11 +1928,10 @@ class Boxes:
         if self.debug:
             self.rectangularHole(0, 0, width, width)
         self.hole(0, 0, 0.5 * flange)
-        for x in (-1, 1):
-            for y in (-1, 1):
-                self.hole(
-                    x * 0.5 * holedistance, y * 0.5 * holedistance, 0.5 * diameter
-                )
+        d = 0.5 * holedistance
+        self.holes(
+            [(x * d, y * d) for x in (-1, 1) for y in (-1, 1)], 0.5 * diameter
+        )
 
     def drawPoints(self, lines, kerfdir=1, close=True):
         if not lines:
@@ -1659,16 +1941,13 @@ class Boxes:
             lines = kerf(lines, self.burn * kerfdir, closed=close)
 
         self.ctx.save()
-        self.ctx.move_to(*lines[0])
-
-        for x, y in lines[1:]:
-            self.ctx.line_to(x, y)
-
-        if close:
-            self.ctx.line_to(*lines[0])
+        self.ctx.add_polyline(lines, close)
         self.ctx.restore()
 
     def qrcode(self, content, box_size=1.0, color=Color.ETCHING, move=None):
+        import qrcode
+        from boxes.qrcode_factory import BoxesQrCodeFactory
+
         q = qrcode.QRCode(image_factory=BoxesQrCodeFactory, box_size=box_size * 10)
         q.add_data(content)
         m = q.get_matrix()
@@ -1691,19 +1970,16 @@ class Boxes:
         """
         self.set_source_color(color)
         self.ctx.save()
-        self.ctx.move_to(*border[0])
-
-        for x, y in border[1:]:
-            self.ctx.line_to(x, y)
-
-        self.ctx.line_to(*border[0])
+        self.ctx.add_polyline(border, close=True)
         self.ctx.restore()
 
-        i = 0
-        for x, y in border:
-            i += 1
+        ctx = self.ctx
+        for i, (x, y) in enumerate(border, 1):
             self.hole(x, y, 0.5, color=color)
-            self.text(str(i), x, y, fontsize=2, color=color)
+            # same as self.text(str(i), x, y, fontsize=2, color=color)
+            with self.saved_context():
+                self.moveTo(x, y)
+                ctx.show_text(str(i), fs=2, align="left", rgb=color, font="Arial")
 
     @restore
     @holeCol
@@ -1735,6 +2011,9 @@ class Boxes:
         if pattern not in ["random", "hex", "square", "hbar", "vbar"]:
             return
 
+        from shapely.geometry import Polygon, Point
+        from shapely.prepared import prep
+
         a = 0
         if style == "round":
             n = 0
@@ -1754,6 +2033,8 @@ class Boxes:
 
         # note to myself: ^y  x>
 
+        polygonHole = self.regularPolygonHole
+
         if self.debug:
             self.showBorderPoly(border)
 
@@ -1795,55 +2076,76 @@ class Boxes:
             max_radius_y = (max_y - min_y - 2 * bspace - (ny - 1) * hspace) / ny / 2
 
         if pattern == "random":
+            # holes as (x, y, r) tuples in a grid of cells of maximum hole size
             grid = {}
+            grid_get = grid.get
+            cell = 2 * max_radius + hspace
+            neighbours = ((0, 0),) + tuple(
+                (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+            )
+            sqrt = math.sqrt
+            exterior = borderPoly.exterior
+            # parts of the (integer) rows within the border, points on
+            # the height of a corner are left to shapely
+            edges = _polygonEdges(borderPoly)
+            corner_ys = {y1 for x1, y1, x2, y2 in edges}
+            border_contains = prep(borderPoly).contains
+            rows = {}
+            randrange = random.randrange
+            x_range = (math.floor(min_x + bspace), math.ceil(max_x - bspace))
+            y_range = (math.floor(min_y + bspace), math.ceil(max_y - bspace))
             misses = 0  # in a row
             while i < max_random and misses < 20:
                 i += 1
                 misses += 1
                 # random new point
-                x = random.randrange(
-                    math.floor(min_x + bspace), math.ceil(max_x - bspace)
-                )  # randomness takes longer to compute
-                y = random.randrange(
-                    math.floor(min_y + bspace), math.ceil(max_y - bspace)
-                )  # but generates a new pattern for each run
-                pt = Point(x, y).buffer(min_radius + bspace)
+                x = randrange(*x_range)  # randomness takes longer to compute
+                y = randrange(*y_range)  # but generates a new pattern for each run
                 # check if point is within border
-                if borderPoly.contains(pt):
-                    pt1 = Point(x, y)
-                    grid_x = int(x // (2 * max_radius + hspace))
-                    grid_y = int(y // (2 * max_radius + hspace))
-                    # compute distance between hole and border
-                    bdist = borderPoly.exterior.distance(pt1) - bspace
-                    # compute minimum distance to all other holes
-                    hdist = max_radius
-                    try:  # learned from https://medium.com/techtofreedom/5-ways-to-break-out-of-nested-loops-in-python-4c505d34ace7
-                        for gx in (-1, 0, 1):
-                            for gy in (-1, 0, 1):
-                                for pt2 in grid.get((grid_x + gx, grid_y + gy), []):
-                                    pt3 = Point(pt2.x, pt2.y)
-                                    hdist = min(
-                                        hdist, pt1.distance(pt3) - pt2.z - hspace
-                                    )
-                                    if hdist < min_radius:
-                                        hdist = 0
-                                        raise StopIteration
-                    except StopIteration:
-                        pass
-                    # find maximum radius depending on distances
-                    r = min(bdist, hdist)
-                    # if too small, dismiss cycle
-                    if r < min_radius:
+                if y in corner_ys:
+                    pt = Point(x, y)
+                    if not border_contains(pt):
                         continue
-                    # if too large, limit to max size
-                    if r > max_radius:
-                        r = max_radius
-                    # store in grid with radius as z value
-                    grid.setdefault((grid_x, grid_y), []).append(Point(x, y, r))
-                    misses = 0
-                    # and finally paint the hole
-                    self.regularPolygonHole(x, y, r=r, n=n, a=a)
-                    # rinse and repeat
+                else:
+                    if y not in rows:
+                        rows[y] = _scanline(edges, y)
+                    for x_start, x_end in rows[y]:
+                        if x_start < x < x_end:
+                            break
+                    else:
+                        continue
+                    pt = Point(x, y)
+                # compute distance between hole and border
+                bdist = exterior.distance(pt) - bspace
+                if bdist < min_radius:
+                    continue
+                grid_x = int(x // cell)
+                grid_y = int(y // cell)
+                # compute minimum distance to all other holes
+                # starting with the own cell where conflicts are most likely
+                hdist = max_radius
+                for dx, dy in neighbours:
+                    for x2, y2, r2 in grid_get((grid_x + dx, grid_y + dy), ()):
+                        d = sqrt((x - x2) ** 2 + (y - y2) ** 2) - r2 - hspace
+                        if d < hdist:
+                            hdist = d
+                    if hdist < min_radius:
+                        hdist = 0
+                        break
+                # find maximum radius depending on distances
+                r = min(bdist, hdist)
+                # if too small, dismiss cycle
+                if r < min_radius:
+                    continue
+                # if too large, limit to max size
+                if r > max_radius:
+                    r = max_radius
+                # store in grid
+                grid.setdefault((grid_x, grid_y), []).append((x, y, r))
+                misses = 0
+                # and finally paint the hole
+                polygonHole(x, y, r=r, n=n, a=a)
+                # rinse and repeat
 
         elif pattern in ("square", "hex"):
             # use 'optimum' hole size
@@ -1856,22 +2158,28 @@ class Boxes:
             # make cutPolys a little wider to avoid
             # overlapping with lines to be cut
             outerCutPoly = borderPoly.buffer(-1 * (bspace - 0.000001), join_style=2)
-            outerTestPoly = borderPoly.buffer(-1 * (bspace - 0.01), join_style=2)
             # shrink original polygon to get place for full size polygons
             innerCutPoly = borderPoly.buffer(
                 -1 * (bspace + max_radius - 0.0001), join_style=2
             )
-            innerTestPoly = borderPoly.buffer(
-                -1 * (bspace + max_radius - 0.001), join_style=2
-            )
-
-            # get left and right boundaries of cut polygon
-            x_cpl, y_cpl, x_cpr, y_cpr = outerCutPoly.bounds
 
             if self.debug:
                 self.showBorderPoly(list(outerCutPoly.exterior.coords))
                 self.showBorderPoly(list(innerCutPoly.exterior.coords))
 
+            # cut the rows with the edges of both polygons directly
+            # instead of splitting a LineString per row
+            outer_edges = _polygonEdges(outerCutPoly)
+            inner_edges = _polygonEdges(innerCutPoly)
+
+            exterior = borderPoly.exterior
+            # step widths
+            step_x = 2 * max_radius_x + hspace
+            if pattern == "square":
+                step_y = 2 * max_radius_y + hspace - 0.0001
+            else:
+                step_y = (math.sqrt(3) / 2 * (2 * max_radius_y + hspace)) - 0.0001
+
             # set startpoint
             y = min_y + bspace + max_radius_y
 
@@ -1881,55 +2189,34 @@ class Boxes:
                 else:
                     xs = min_x + max_radius_x * 2 + hspace / 2 + bspace
 
-                # create line segments cut by the polygons
-                line_complete = LineString([(x_cpl, y), (max_x + 1, y)])
-                # cut accurate
-                outer_line_split = split(line_complete, outerCutPoly)
-                line_complete = LineString([(x_cpl, y), (max_x + 1, y)])
-                inner_line_split = split(line_complete, innerCutPoly)
+                # parts of the row within the polygons
+                outer_lines = _scanline(outer_edges, y)
+                inner_bounds = _scanline(inner_edges, y)
                 inner_line_index = 0
 
                 if self.debug and False:
-                    for line in inner_line_split.geoms:
-                        self.hole(line.bounds[0], line.bounds[1], 1.1)
-                        self.hole(line.bounds[2], line.bounds[3], 0.9)
+                    for x_start, x_end in inner_bounds:
+                        self.hole(x_start, y, 1.1)
+                        self.hole(x_end, y, 0.9)
 
                 # process each line
-                for line_this in outer_line_split.geoms:
+                for x_start, x_end in outer_lines:
                     if self.debug and False:  # enable to debug missing lines
-                        x_start, y_start, x_end, y_end = line_this.bounds
                         with self.saved_context():
-                            self.moveTo(x_start, y_start, 0)
+                            self.moveTo(x_start, y, 0)
                             self.hole(0, 0, 0.5)
                             self.edge(x_end - x_start)
                         with self.saved_context():
-                            self.moveTo(x_start, y_start, 0)
-                            self.text(
-                                str(outerTestPoly.contains(line_this)),
-                                0,
-                                0,
-                                fontsize=2,
-                                color=Color.ANNOTATIONS,
-                            )
-                        with self.saved_context():
-                            self.moveTo(x_end, y_end, 0)
+                            self.moveTo(x_end, y, 0)
                             self.hole(0, 0, 0.5)
 
-                    if not outerTestPoly.contains(line_this):
-                        continue
-                    x_start, y_start, x_end, y_end = line_this.bounds
                     # initialize walking x coordinate
-                    xw = (
-                        math.ceil((x_start - xs) / (2 * max_radius_x + hspace))
-                        * (2 * max_radius_x + hspace)
-                    ) + xs
+                    xw = (math.ceil((x_start - xs) / step_x) * step_x) + xs
 
                     # look up matching inner line
-                    while inner_line_index < len(inner_line_split) and (
-                        inner_line_split.geoms[inner_line_index].bounds[2] < xw
-                        or not innerTestPoly.contains(
-                            inner_line_split.geoms[inner_line_index]
-                        )
+                    while (
+                        inner_line_index < len(inner_bounds)
+                        and inner_bounds[inner_line_index][1] < xw
                     ):
                         inner_line_index += 1
 
@@ -1937,21 +2224,17 @@ class Boxes:
                     while not xw > x_end:
                         # are we in inner polygon already?
                         if (
-                            len(inner_line_split) > inner_line_index
-                            and xw > inner_line_split.geoms[inner_line_index].bounds[0]
+                            len(inner_bounds) > inner_line_index
+                            and xw > inner_bounds[inner_line_index][0]
                         ):
                             # place inner, full size polygons
-                            while (
-                                xw < inner_line_split.geoms[inner_line_index].bounds[2]
-                            ):
-                                self.regularPolygonHole(xw, y, r=max_radius, n=n, a=a)
-                                xw += 2 * max_radius_x + hspace
+                            while xw < inner_bounds[inner_line_index][1]:
+                                polygonHole(xw, y, r=max_radius, n=n, a=a)
+                                xw += step_x
                             # forward to next inner line
-                            while inner_line_index < len(inner_line_split) and (
-                                inner_line_split.geoms[inner_line_index].bounds[0] < xw
-                                or not innerTestPoly.contains(
-                                    inner_line_split.geoms[inner_line_index]
-                                )
+                            while (
+                                inner_line_index < len(inner_bounds)
+                                and inner_bounds[inner_line_index][0] < xw
                             ):
                                 inner_line_index += 1
                             if xw > x_end:
@@ -1959,17 +2242,14 @@ class Boxes:
 
                         # Check distance to border to size the polygon
                         pt = Point(xw, y)
-                        r = min(borderPoly.exterior.distance(pt) - bspace, max_radius)
+                        r = min(exterior.distance(pt) - bspace, max_radius)
                         # if too small, dismiss
                         if r >= min_radius:
-                            self.regularPolygonHole(xw, y, r=r, n=n, a=a)
-                        xw += 2 * max_radius_x + hspace
+                            polygonHole(xw, y, r=r, n=n, a=a)
+                        xw += step_x
 
                 row += 1
-                if pattern == "square":
-                    y += 2 * max_radius_y + hspace - 0.0001
-                else:
-                    y += (math.sqrt(3) / 2 * (2 * max_radius_y + hspace)) - 0.0001
+                y += step_y
 
         elif pattern == "hbar":
             # 'optimum' hole size to be used
@@ -1979,15 +2259,15 @@ class Boxes:
                 return
 
             # shrink original polygon
-            shrinkPoly = borderPoly.buffer(
-                -1 * (bspace + max_radius - 0.01), join_style=2
-            )
             cutPoly = borderPoly.buffer(
                 -1 * (bspace + max_radius - 0.000001), join_style=2
             )
 
             if self.debug:
-                self.showBorderPoly(list(shrinkPoly.exterior.coords))
+                self.showBorderPoly(list(cutPoly.exterior.coords))
+
+            # cut the rows with the edges of the polygon directly
+            cut_edges = _polygonEdges(cutPoly)
 
             segment_length = [bar_length / 2, bar_length]
             segment_max = 1
@@ -2004,109 +2284,90 @@ class Boxes:
                     segment_max = 0
                 segment_toggle ^= 1
 
-                # create line from left to right and cut according to shrunk polygon
-                line_complete = LineString([(min_x - 1, y), (max_x + 1, y)])
-                line_split = split(line_complete, cutPoly)
-
-                # process each line
-                for line_this in line_split.geoms:
+                # process each part of the row within the shrunk polygon
+                for x_start, x_end in _scanline(cut_edges, y):
                     if self.debug and False:  # enable to debug missing lines
-                        x_start, y_start, x_end, y_end = line_this.bounds
                         with self.saved_context():
-                            self.moveTo(x_start, y_start, 0)
+                            self.moveTo(x_start, y, 0)
                             self.hole(0, 0, 0.5)
                             self.edge(x_end - x_start)
                         with self.saved_context():
-                            self.moveTo(x_start, y_start, 0)
-                            self.text(
-                                str(shrinkPoly.contains(line_this)),
-                                0,
-                                0,
-                                fontsize=2,
-                                color=Color.ANNOTATIONS,
-                            )
-                        with self.saved_context():
-                            self.moveTo(x_end, y_end, 0)
+                            self.moveTo(x_end, y, 0)
                             self.hole(0, 0, 0.5)
 
-                    if shrinkPoly.contains(line_this):
-                        # long segment are cut down further
-                        if line_this.length > segment_length[segment_max]:
-                            line_working = line_this
-                            length = line_working.length
-                            while length > 0:
-                                x_start, y_start, xw_end, yw_end = line_working.bounds
-                                # calculate point with required distance from start point
-                                p = line_working.interpolate(
-                                    segment_length[segment_max]
-                                )
-                                # and use its coordinates as endpoint for this segment
-                                x_end = p.x
-                                y_end = p.y
-                                # draw segment
-                                self.set_source_color(Color.INNER_CUT)
-                                with self.saved_context():
-                                    self.moveTo(x_start, y_start + max_radius, 0)
-                                    self.edge(x_end - x_start)
-                                    self.corner(-180, max_radius)
-                                    self.edge(x_end - x_start)
-                                    self.corner(-180, max_radius)
-
-                                if (
-                                    self.debug and False
-                                ):  # enable to debug cutting lines
-                                    self.set_source_color(Color.ANNOTATIONS)
-                                    with self.saved_context():
-                                        self.moveTo(x_start, y_start, 0)
-                                        self.edge(x_end - x_start)
-
-                                    s = (
-                                        "long - y: "
-                                        + str(round(y, 1))
-                                        + " xs: "
-                                        + str(round(x_start, 1))
-                                        + " xe: "
-                                        + str(round(x_end, 1))
-                                        + " l: "
-                                        + str(round(length, 1))
-                                        + " max: "
-                                        + str(round(segment_length[segment_max], 1))
-                                    )
-                                    with self.saved_context():
-                                        self.text(
-                                            s,
-                                            x_start,
-                                            y_start,
-                                            fontsize=2,
-                                            color=Color.ANNOTATIONS,
-                                        )
-
-                                # subtract length of segmant from total segment length
-                                length -= x_end - x_start + hspace + 2 * max_radius
-                                # create remaining line to work with
-                                line_working = LineString(
-                                    [
-                                        (x_end + hspace + 2 * max_radius, y_end),
-                                        (xw_end, yw_end),
-                                    ]
-                                )
-                                # next segment shall be long
-                                segment_max = 1
-                        else:
-                            # short segment can be drawn instantly
-                            x_start, y_start, x_end, y_end = line_this.bounds
+                    # long segment are cut down further
+                    if x_end - x_start > segment_length[segment_max]:
+                        # remaining line to work with from xw_from to xw_to
+                        xw_from, xw_to = x_start, x_end
+                        length = x_end - x_start
+                        while length > 0:
+                            x_start = min(xw_from, xw_to)
+                            xw_end = max(xw_from, xw_to)
+                            # calculate point with required distance from start point
+                            # and use it as endpoint for this segment
+                            line_length = abs(xw_to - xw_from)
+                            if segment_length[segment_max] < line_length:
+                                x_end = (xw_to - xw_from) * (
+                                    segment_length[segment_max] / line_length
+                                ) + xw_from
+                            else:
+                                x_end = xw_to
+                            # draw segment
                             self.set_source_color(Color.INNER_CUT)
                             with self.saved_context():
-                                self.moveTo(x_start, y_start + max_radius, 0)
+                                self.moveTo(x_start, y + max_radius, 0)
                                 self.edge(x_end - x_start)
                                 self.corner(-180, max_radius)
                                 self.edge(x_end - x_start)
                                 self.corner(-180, max_radius)
 
+                            if self.debug and False:  # enable to debug cutting lines
+                                self.set_source_color(Color.ANNOTATIONS)
+                                with self.saved_context():
+                                    self.moveTo(x_start, y, 0)
+                                    self.edge(x_end - x_start)
+
+                                s = (
+                                    "long - y: "
+                                    + str(round(y, 1))
+                                    + " xs: "
+                                    + str(round(x_start, 1))
+                                    + " xe: "
+                                    + str(round(x_end, 1))
+                                    + " l: "
+                                    + str(round(length, 1))
+                                    + " max: "
+                                    + str(round(segment_length[segment_max], 1))
+                                )
+                                with self.saved_context():
+                                    self.text(
+                                        s,
+                                        x_start,
+                                        y,
+                                        fontsize=2,
+                                        color=Color.ANNOTATIONS,
+                                    )
+
+                            # subtract length of segmant from total segment length
+                            length -= x_end - x_start + hspace + 2 * max_radius
+                            # remaining line to work with
+                            xw_from, xw_to = x_end + hspace + 2 * max_radius, xw_end
+                            # next segment shall be long
                             segment_max = 1
-                            # short segment shall be skipped if a short segment shall start the line
-                            if segment_toggle:
-                                segment_max = 0
+                    else:
+                        # short segment can be drawn instantly
+                        self.set_source_color(Color.INNER_CUT)
+                        with self.saved_context():
+                            self.moveTo(x_start, y + max_radius, 0)
+                            self.edge(x_end - x_start)
+                            self.corner(-180, max_radius)
+                            self.edge(x_end - x_start)
+                            self.corner(-180, max_radius)
+
+                        segment_max = 1
+                        # short segment shall be skipped if a short segment shall start the line
+                        if segment_toggle:
+                            segment_max = 0
                 y += step_y
         else:
             raise ValueError("fillHoles - unknown hole pattern: %s)" % pattern)
@@ -2129,31 +2390,44 @@ class Boxes:
         if settings is None:
             settings = self.hexHolesSettings
         r, b = settings.diameter / 2, settings.distance
+        if r <= 0:
+            return
 
         w = r + b / 2.0
-        dist = w * math.cos(math.pi / 6.0)
+        dist = w * _COS30
 
         # how many half circles do fit
         cx = int((x - 2 * r) // (w)) + 2
         cy = int((y - 2 * r) // (dist)) + 2
+        if cx < 2 or cy < 2:
+            return
 
         # what's left on the sides
         lx = (x - (2 * r + (cx - 2) * w)) / 2.0
         ly = (y - (2 * r + ((cy // 2) * 2) * dist - 2 * dist)) / 2.0
 
+        # x positions in even and odd rows
+        columns = (
+            [2 * j * w + r + lx for j in range(cx // 2)],
+            [2 * j * w + r + lx + w for j in range((cx - 1) // 2)],
+        )
+        holes = []
         for i in range(cy // 2):
-            for j in range((cx - (i % 2)) // 2):
-                px = 2 * j * w + r + lx
-                py = i * 2 * dist + r + ly
-                if i % 2:
-                    px += w
-                if skip and skip(x, y, r, b, px, py):
-                    continue
-                self.hole(px, py, r=r)
+            py = i * 2 * dist + r + ly
+            if skip:
+                holes.extend(
+                    (px, py) for px in columns[i % 2] if not skip(x, y, r, b, px, py)
+                )
+            else:
+                holes.extend((px, py) for px in columns[i % 2])
+        if holes:
+            self.holes(holes, r=r)
 
     def __skipcircle(self, x, y, r, b, posx, posy):
         cx, cy = x / 2.0, y / 2.0
-        return dist(posx - cx, posy - cy) > (cx - r)
+        dx, dy = posx - cx, posy - cy
+        # compare squared distances, but the sqrt() is never negative
+        return cx - r < 0 or dx * dx + dy * dy > (cx - r) ** 2
 
     def hexHolesCircle(self, d, settings=None):
         """
@@ -2174,6 +2448,8 @@ class Boxes:
         :param settings:  (Default value = None)
         """
 
+        rc2 = rc * rc
+
         def skip(x, y, r, b, posx, posy):
             """
             :param x:
@@ -2191,7 +2467,9 @@ class Boxes:
 
             if (posx <= wx) or (posy <= wx):
                 return 0
-            return dist(posx - wx, posy - wy) > rc
+            dx, dy = posx - wx, posy - wy
+            # compare squared distances, but the sqrt() is never negative
+            return rc < 0 or dx * dx + dy * dy > rc2
 
         self.hexHolesRectangle(x, y, settings, skip=skip)
 
@@ -2209,7 +2487,7 @@ class Boxes:
 
         self.ctx.rectangle(0, 0, h, h)
         w = r + b / 2.0
-        dist = w * math.cos(math.pi / 6.0)
+        dist = w * _COS30
         cy = 2 * int((h - 4 * dist) // (4 * w)) + 1
 
         leftover = h - 2 * r - (cy - 1) * 2 * r
@@ -2218,7 +2496,7 @@ class Boxes:
 
         # recalculate with adjusted values
         w = r + b / 2.0
-        dist = w * math.cos(math.pi / 6.0)
+        dist = w * _COS30
 
         self.moveTo(h / 2.0 - (cy // 2) * 2 * w, h / 2.0)
         for j in range(cy):
@@ -2248,22 +2526,34 @@ class Boxes:
 
         armx = (4 * wx, 90, 4 * wy, 90, 2 * wx, 90, 2 * wy)
         army = (4 * wy, 90, 4 * wx, 90, 2 * wy, 90, 2 * wx)
+        # grid lines of the cells
+        xs = [(5 * i) * wx for i in range(cx + 1)]
+        ys = [(5 * j) * wy for j in range(cy + 1)]
+        # plain save/restore pairs - nothing in here is expected to raise
+        save, restore = self.ctx.save, self.ctx.restore
+        moveTo, polyline = self.moveTo, self._polyline
         for i in range(cx):
+            x0, x1 = xs[i], xs[i + 1]
             for j in range(cy):
+                y0, y1 = ys[j], ys[j + 1]
                 if (i + j) % 2:
-                    with self.saved_context():
-                        self.moveTo((5 * i) * wx, (5 * j) * wy)
-                        self.polyline(*armx)
-                    with self.saved_context():
-                        self.moveTo((5 * i + 5) * wx, (5 * j + 5) * wy, -180)
-                        self.polyline(*armx)
+                    save()
+                    moveTo(x0, y0)
+                    polyline(armx)
+                    restore()
+                    save()
+                    moveTo(x1, y1, -180)
+                    polyline(armx)
+                    restore()
                 else:
-                    with self.saved_context():
-                        self.moveTo((5 * i + 5) * wx, (5 * j) * wy, 90)
-                        self.polyline(*army)
-                    with self.saved_context():
-                        self.moveTo((5 * i) * wx, (5 * j + 5) * wy, -90)
-                        self.polyline(*army)
+                    save()
+                    moveTo(x1, y0, 90)
+                    polyline(army)
+                    restore()
+                    save()
+                    moveTo(x0, y1, -90)
+                    polyline(army)
+                    restore()
         self.ctx.stroke()
 
     @restore
@@ -2292,17 +2582,20 @@ class Boxes:
     ### parts
     ##################################################
 
+    # sides to split for 0 to 4 pieces
+    _wall_splits = (
+        (False, False, False, False, True),
+        (True, False, False, False, True),
+        (True, False, True, False, True),
+        (True, True, True, False, True),
+        (True, True, True, True, True),
+    )
+
     def _splitWall(self, pieces, side):
         """helper for roundedPlate and surroundingWall
         figures out what sides to split
         """
-        return [
-            (False, False, False, False, True),
-            (True, False, False, False, True),
-            (True, False, True, False, True),
-            (True, True, True, False, True),
-            (True, True, True, True, True),
-        ][pieces][side]
+        return self._wall_splits[pieces][side]
 
     def roundedPlate(
         self,
@@ -2339,9 +2632,10 @@ class Boxes:
         corner_holes = True
 
         t = self.thickness
-        edge = self.edges.get(edge, edge)
-        overallwidth = x + 2 * edge.spacing()
-        overallheight = y + 2 * edge.spacing()
+        edge = self._resolve_edge(edge)
+        spacing = edge.spacing()
+        overallwidth = x + 2 * spacing
+        overallheight = y + 2 * spacing
 
         if self.move(overallwidth, overallheight, move, before=True):
             return
@@ -2349,12 +2643,31 @@ class Boxes:
         lx = x - 2 * r
         ly = y - 2 * r
 
-        self.moveTo(edge.spacing(), edge.margin())
+        self.moveTo(spacing, edge.margin())
         self.moveTo(r, 0)
 
         if wallpieces > 4:
             wallpieces = 4
 
+        # outline of the cut-out at each corner - the same for all four
+        corner_hole = (0, (90, r), 0, -90, t, -90, 0, (-90, r + t), 0, -90, t, -90, 0)
+
+        def extended_corner():
+            if corner_holes:
+                self.ctx.save()
+                self.moveTo(0, edge.startwidth())
+                self.polyline(*corner_hole)
+                self.ctx.stroke()
+                self.ctx.restore()
+            self.corner(90, r + edge.startwidth())
+
+        def simple_corner():
+            self.step(-edge.endwidth())
+            self.corner(90, r)
+            self.step(edge.startwidth())
+
+        draw_corner = extended_corner if extend_corners else simple_corner
+
         wallcount = 0
         for nr, square in enumerate((lx, ly, lx, ly)):
             if self._splitWall(wallpieces, nr):
@@ -2374,36 +2687,13 @@ class Boxes:
                     bedBoltSettings=self.getEntry(bedBoltSettings, wallcount),
                 )
                 wallcount += 1
-            if extend_corners:
-                if corner_holes:
-                    with self.saved_context():
-                        self.moveTo(0, edge.startwidth())
-                        self.polyline(
-                            0,
-                            (90, r),
-                            0,
-                            -90,
-                            t,
-                            -90,
-                            0,
-                            (-90, r + t),
-                            0,
-                            -90,
-                            t,
-                            -90,
-                            0,
-                        )
-                        self.ctx.stroke()
-                self.corner(90, r + edge.startwidth())
-            else:
-                self.step(-edge.endwidth())
-                self.corner(90, r)
-                self.step(edge.startwidth())
+            draw_corner()
 
         self.ctx.restore()
         self.ctx.save()
 
-        self.moveTo(edge.margin(), edge.margin())
+        margin = edge.margin()
+        self.moveTo(margin, margin)
 
         if holesMargin is not None:
             self.moveTo(holesMargin, holesMargin)
@@ -2428,13 +2718,14 @@ class Boxes:
         :param pieces: (Default value = 1) number of separate pieces
         :return: (left, length, right) left and right are Booleans that are True if the start or end of the wall is on that side.
         """
-        if pieces <= 2 and (y - 2 * r) < 1e-3:
+        span_x, span_y = x - 2 * r, y - 2 * r
+        if pieces <= 2 and span_y < 1e-3:
             # remove zero length y sides
-            sides = (x / 2 - r, x - 2 * r, x - 2 * r)
+            sides = (x / 2 - r, span_x, span_x)
             if pieces > 0:  # hack to get the right splits
                 pieces += 1
         else:
-            sides = (x / 2 - r, y - 2 * r, x - 2 * r, y - 2 * r, x - 2 * r)
+            sides = (x / 2 - r, span_y, span_x, span_y, span_x)
 
         wallcount = 0
         for nr, square in enumerate(sides):
@@ -2484,13 +2775,13 @@ class Boxes:
         :param move:  (Default value = None)
         """
         t = self.thickness
-        c4 = (r + self.burn) * math.pi * 0.5  # circumference of quarter circle
+        c4 = (r + self.burn) * _HALF_PI  # circumference of quarter circle
         c4 = c4 / self.edges["X"].settings.stretch
 
-        top = self.edges.get(top, top)
-        bottom = self.edges.get(bottom, bottom)
-        left = self.edges.get(left, left)
-        right = self.edges.get(right, right)
+        top = self._resolve_edge(top)
+        bottom = self._resolve_edge(bottom)
+        left = self._resolve_edge(left)
+        right = self._resolve_edge(right)
 
         # XXX assumes startwidth == endwidth
         if extend_corners:
@@ -2514,59 +2805,68 @@ class Boxes:
             return
 
         self.moveTo(left.spacing(), bottom.margin())
+        # gap between two wall pieces
+        gap = right.margin() + left.margin() + self.spacing
 
         wallcount = 0
         tops = []  # edges needed on the top for this wall segment
 
-        if pieces <= 2 and (y - 2 * r) < 1e-3:
+        span_x, span_y = x - 2 * r, y - 2 * r
+        if pieces <= 2 and span_y < 1e-3:
             # remove zero length y sides
             c4 *= 2
-            sides = (x / 2 - r, x - 2 * r, x - 2 * r)
+            sides = (x / 2 - r, span_x, span_x)
             if pieces > 0:  # hack to get the right splits
                 pieces += 1
         else:
-            sides = (x / 2 - r, y - 2 * r, x - 2 * r, y - 2 * r, x - 2 * r)
+            sides = (x / 2 - r, span_y, span_x, span_y, span_x)
+
+        cc, step, edge, moveTo = self.cc, self.step, self.edge, self.moveTo
+        edgeCorner = self.edgeCorner
+        flex = self.edges["X"]
+        bottom_y = bottomwidth + self.burn
 
         for nr, square in enumerate(sides):
             if self._splitWall(pieces, nr) and nr > 0:
-                self.cc(callback, wallcount, y=bottomwidth + self.burn)
+                half = square / 2.0
+                cc(callback, wallcount, y=bottom_y)
                 wallcount += 1
-                bottom(square / 2.0)
-                tops.append(square / 2.0)
+                bottom(half)
+                tops.append(half)
 
                 # complete wall segment
                 with self.saved_context():
-                    self.edgeCorner(bottom, right, 90)
+                    edgeCorner(bottom, right, 90)
                     right(h)
-                    self.edgeCorner(right, top, 90)
+                    edgeCorner(right, top, 90)
                     for n, d in enumerate(reversed(tops)):
                         if n % 2:  # flex
-                            self.step(topwidth - top.endwidth())
-                            self.edge(d)
-                            self.step(top.startwidth() - topwidth)
+                            step(topwidth - top.endwidth())
+                            edge(d)
+                            step(top.startwidth() - topwidth)
                         else:
                             top(d)
-                    self.edgeCorner(top, left, 90)
+                    edgeCorner(top, left, 90)
                     left(h)
-                    self.edgeCorner(left, bottom, 90)
+                    edgeCorner(left, bottom, 90)
 
                 if nr == len(sides) - 1:
                     break
                 # start new wall segment
                 tops = []
-                self.moveTo(right.margin() + left.margin() + self.spacing)
-                self.cc(callback, wallcount, y=bottomwidth + self.burn)
+                moveTo(gap)
+                cc(callback, wallcount, y=bottom_y)
                 wallcount += 1
-                bottom(square / 2.0)
-                tops.append(square / 2.0)
+                bottom(half)
+                tops.append(half)
             else:
-                self.cc(callback, wallcount, y=bottomwidth + self.burn)
+                cc(callback, wallcount, y=bottom_y)
                 wallcount += 1
                 bottom(square)
                 tops.append(square)
-            self.step(bottomwidth - bottom.endwidth())
-            self.edges["X"](c4, h + topwidth + bottomwidth)
-            self.step(bottom.startwidth() - bottomwidth)
+            step(bottomwidth - bottom.endwidth())
+            flex(c4, h + topwidth + bottomwidth)
+            step(bottom.startwidth() - bottomwidth)
             tops.append(c4)
 
         self.move(overallwidth, overallheight, move)
@@ -2602,24 +2902,65 @@ class Boxes:
         """
         if len(edges) != 4:
             raise ValueError("four edges required")
-        edges = [self.edges.get(e, e) for e in edges]
+        edges = self._resolve_edges(edges)
         edges += edges  # append for wrapping around
-        overallwidth = x + edges[-1].spacing() + edges[1].spacing()
-        overallheight = y + edges[0].spacing() + edges[2].spacing()
+        spacings = [e.spacing() for e in edges[:4]]
+        startwidths = [e.startwidth() for e in edges[:4]] * 2
+        overallwidth = x + spacings[3] + spacings[1]
+        overallheight = y + spacings[0] + spacings[2]
 
         if self.move(overallwidth, overallheight, move, before=True):
             return
 
+        self._rectangularWallOutline(
+            x,
+            y,
+            edges,
+            spacings,
+            startwidths,
+            ignore_widths,
+            bedBolts,
+            bedBoltSettings,
+            callback,
+        )
+
+        if holesMargin is not None:
+            self.moveTo(holesMargin, holesMargin + startwidths[0])
+            self.hexHolesRectangle(
+                x - 2 * holesMargin, y - 2 * holesMargin, settings=holesSettings
+            )
+
+        self.move(overallwidth, overallheight, move, label=label)
+
+    def _rectangularWallOutline(
+        self,
+        x,
+        y,
+        edges,
+        spacings,
+        startwidths,
+        ignore_widths=(),
+        bedBolts=None,
+        bedBoltSettings=None,
+        callback=None,
+    ):
+        """Draw the edges of .rectangularWall() starting at its lower left corner
+
+        :param edges: the four edge objects, twice for wrapping around
+        :param spacings: spacing of the four edges
+        :param startwidths: start widths of the edges, twice
+        """
+        burn = self.burn
         if 7 not in ignore_widths:
-            self.moveTo(edges[-1].spacing())
+            self.moveTo(spacings[3])
         self.moveTo(0, edges[0].margin())
         for i, square in enumerate((x, y, x, y)):
-            self.cc(callback, i, y=edges[i].startwidth() + self.burn)
+            self.cc(callback, i, y=startwidths[i] + burn)
             e1, e2 = edges[i], edges[i + 1]
             if 2 * i - 1 in ignore_widths or 2 * i - 1 + 8 in ignore_widths:
                 square += edges[i - 1].endwidth()
             if 2 * i in ignore_widths:
-                square += edges[i + 1].startwidth()
+                square += startwidths[i + 1]
                 e2 = self.edges["e"]
             if 2 * i + 1 in ignore_widths:
                 e1 = self.edges["e"]
@@ -2631,12 +2972,54 @@ class Boxes:
             )
             self.edgeCorner(e1, e2, 90)
 
-        if holesMargin is not None:
-            self.moveTo(holesMargin, holesMargin + edges[0].startwidth())
-            self.hexHolesRectangle(
-                x - 2 * holesMargin, y - 2 * holesMargin, settings=holesSettings
-            )
+    def _cachedRectangularWall(self, x, y, edges="eeee", move=None, label=""):
+        """
+        Rectangular wall whose outline is only calculated once
+
+        Further walls with the same size, edges and edge settings replay
+        the recorded outline at the new position. Only plain and finger
+        joint edges are supported as others may cut holes.
+
+        :param x: width
+        :param y: height
+        :param edges:  (Default value = "eeee") bottom, right, top, left
+        :param move:  (Default value = None)
+        :param label: rendered to identify parts, it is not meant to be cut or etched (Default value = "")
+        """
+        if len(edges) != 4:
+            raise ValueError("four edges required")
+        edges = self._resolve_edges(edges)
+        for e in edges:
+            if type(e) not in _REPLAYABLE_EDGES:
+                raise ValueError(
+                    f"{e.__class__.__name__} can not be used for a cached wall"
+                )
+        key = (
+            "rectangularWall",
+            x,
+            y,
+            self.burn,
+            self.tabs,
+            tuple(
+                (e, tuple(e.settings.values.items()) if e.settings else None)
+                for e in edges
+            ),
+        )
+        edges += edges  # append for wrapping around
+        spacings = [e.spacing() for e in edges[:4]]
+        startwidths = [e.startwidth() for e in edges[:4]] * 2
+        overallwidth = x + spacings[3] + spacings[1]
+        overallheight = y + spacings[0] + spacings[2]
 
+        if self.move(overallwidth, overallheight, move, before=True):
+            return
+
+        self.ctx.add_shape(
+            key,
+            lambda: self._rectangularWallOutline(
+                x, y, edges, spacings, startwidths
+            ),
+        )
         self.move(overallwidth, overallheight, move, label=label)
 
     def flangedWall(
@@ -2674,7 +3057,7 @@ class Boxes:
         while len(flanges) < 4:
             flanges.append(0.0)
 
-        edges = [self.edges.get(e, e) for e in edges]
+        edges = self._resolve_edges(edges)
         # double to allow looping around
         edges = edges + edges
         flanges = flanges + flanges
@@ -2688,6 +3071,9 @@ class Boxes:
         rl = min(r, max(flanges[-1], flanges[0]))
         self.moveTo(rl + edges[-1].margin(), edges[0].margin())
 
+        startwidths = [e.startwidth() for e in edges[:4]] * 2
+        endwidths = [e.endwidth() for e in edges[:4]] * 2
+
         for i in range(4):
             square = y if i % 2 else x
 
@@ -2697,7 +3083,7 @@ class Boxes:
             if flanges[i]:
                 if edges[i] is self.edges["F"] or edges[i] is self.edges["h"]:
                     self.fingerHolesAt(
-                        flanges[i - 1] + edges[i - 1].endwidth() - rl,
+                        flanges[i - 1] + endwidths[i - 1] - rl,
                         0.5 * t + flanges[i],
                         square,
                         angle=0,
@@ -2706,15 +3092,15 @@ class Boxes:
                     square
                     + flanges[i - 1]
                     + flanges[i + 1]
-                    + edges[i - 1].endwidth()
-                    + edges[i + 1].startwidth()
+                    + endwidths[i - 1]
+                    + startwidths[i + 1]
                     - rl
                     - rr
                 )
             else:
-                self.edge(flanges[i - 1] + edges[i - 1].endwidth() - rl)
+                self.edge(flanges[i - 1] + endwidths[i - 1] - rl)
                 edges[i](square)
-                self.edge(flanges[i + 1] + edges[i + 1].startwidth() - rr)
+                self.edge(flanges[i + 1] + startwidths[i + 1] - rr)
             self.corner(90, rr)
         self.move(tw, th, move, label=label)
 
@@ -2745,7 +3131,7 @@ class Boxes:
         :param move:  (Default value = None)
         :param label: rendered to identify parts, it is not meant to be cut or etched (Default value = "")
         """
-        edges = [self.edges.get(e, e) for e in edges]
+        edges = self._resolve_edges(edges)
         if len(edges) == 2:
             edges.append(self.edges["e"])
         if len(edges) != 3:
@@ -2754,34 +3140,20 @@ class Boxes:
         r = min(r, x, y)
         a = math.atan2(y - r, float(x - r))
         alpha = math.degrees(a)
+        spacing = self.spacing
+        bottom, right, diagonal = (e.spacing() for e in edges)
         if a > 0:
-            width = (
-                x
-                + (edges[-1].spacing() + self.spacing) / math.sin(a)
-                + edges[1].spacing()
-                + self.spacing
-            )
+            width = x + (diagonal + spacing) / math.sin(a) + right + spacing
         else:
-            width = (
-                x
-                + (edges[-1].spacing() + self.spacing)
-                + edges[1].spacing()
-                + self.spacing
-            )
-        height = (
-            y
-            + edges[0].spacing()
-            + edges[2].spacing() * math.cos(a)
-            + 2 * self.spacing
-            + self.spacing
-        )
+            width = x + (diagonal + spacing) + right + spacing
+        height = y + bottom + diagonal * math.cos(a) + 2 * spacing + spacing
         if num > 1:
-            width = 2 * width - x + r - self.spacing
-        dx = width - x - edges[1].spacing() - self.spacing / 2
-        dy = edges[0].margin() + self.spacing / 2
+            width = 2 * width - x + r - spacing
+        dx = width - x - right - spacing / 2
+        dy = edges[0].margin() + spacing / 2
 
-        overallwidth = width * (num // 2 + num % 2) - self.spacing
-        overallheight = height - self.spacing
+        overallwidth = width * (num // 2 + num % 2) - spacing
+        overallheight = height - spacing
 
         if self.move(overallwidth, overallheight, move, before=True):
             return
@@ -2789,7 +3161,12 @@ class Boxes:
         if self.debug:
             self.rectangularHole(width / 2.0, height / 2.0, width, height)
 
-        self.moveTo(dx - self.spacing / 2, dy - self.spacing / 2)
+        self.moveTo(dx - spacing / 2, dy - spacing / 2)
+
+        hypotenuse = math.hypot(x - r, y - r)
+        bottom_start = edges[0].startwidth()
+        diagonal_start = edges[2].startwidth()
+        diagonal_end = edges[2].endwidth()
 
         for n in range(num):
             for i, square in enumerate((x, y)):
@@ -2805,11 +3182,11 @@ class Boxes:
 
             self.corner(alpha, r)
             self.cc(callback, 2)
-            self.step(edges[2].startwidth())
-            edges[2](((x - r) ** 2 + (y - r) ** 2) ** 0.5)
-            self.step(-edges[2].endwidth())
+            self.step(diagonal_start)
+            edges[2](hypotenuse)
+            self.step(-diagonal_end)
             self.corner(90 - alpha, r)
-            self.edge(edges[0].startwidth())
+            self.edge(bottom_start)
             self.corner(90)
             self.ctx.stroke()
 
@@ -2834,18 +3211,19 @@ class Boxes:
         :param label: rendered to identify parts, it is not meant to be cut or etched (Default value = "")
         """
 
-        edges = [self.edges.get(e, e) for e in edges]
+        edges = self._resolve_edges(edges)
 
-        overallwidth = w + edges[-1].spacing() + edges[1].spacing()
+        left = edges[-1].spacing()
+        overallwidth = w + left + edges[1].spacing()
         overallheight = max(h0, h1) + edges[0].spacing()
 
         if self.move(overallwidth, overallheight, move, before=True):
             return
 
         a = math.degrees(math.atan((h1 - h0) / w))
-        square = ((h0 - h1) ** 2 + w**2) ** 0.5
+        square = math.hypot(h0 - h1, w)
 
-        self.moveTo(edges[-1].spacing(), edges[0].margin())
+        self.moveTo(left, edges[0].margin())
         self.cc(callback, 0, y=edges[0].startwidth())
         edges[0](w)
         self.edgeCorner(edges[0], edges[1], 90)
@@ -2879,9 +3257,10 @@ class Boxes:
         :param label: rendered to identify parts, it is not meant to be cut or etched (Default value = "")
         """
 
-        edges = [self.edges.get(e, e) for e in edges]
+        edges = self._resolve_edges(edges)
 
-        overallwidth = w + edges[-1].spacing() + edges[1].spacing()
+        left = edges[-1].spacing()
+        overallwidth = w + left + edges[1].spacing()
         overallheight = max(h0, h1) + edges[0].spacing()
 
         if self.move(overallwidth, overallheight, move, before=True):
@@ -2895,9 +3274,9 @@ class Boxes:
             ws += edges[3].startwidth()
         hs = abs(h1 - h0) - r
         a = math.degrees(math.atan(hs / ws))
-        square = (ws**2 + hs**2) ** 0.5
+        square = math.hypot(ws, hs)
 
-        self.moveTo(edges[-1].spacing(), edges[0].margin())
+        self.moveTo(left, edges[0].margin())
         self.cc(callback, 0, y=edges[0].startwidth())
         edges[0](w)
         self.edgeCorner(edges[0], edges[1], 90)
@@ -2924,23 +3303,18 @@ class Boxes:
 
     def _polygonWallExtend(self, borders, edges, close=False):
         posx, posy = 0, 0
-        ext = [0.0] * 4
+        xs, ys = [0.0], [0.0]  # all points the outline reaches
         angle = 0
-
-        def checkpoint(ext, x, y):
-            ext[0] = min(ext[0], x)
-            ext[1] = min(ext[1], y)
-            ext[2] = max(ext[2], x)
-            ext[3] = max(ext[3], y)
+        cos, sin, radians = math.cos, math.sin, math.radians
 
         # trace edge margins
+        margins = [edge.margin() for edge in edges]
         nborders = []
         for i, val in enumerate(borders):
             if i % 2:
                 nborders.append(val)
             else:
-                edge = edges[(i // 2) % len(edges)]
-                margin = edge.margin()
+                margin = margins[(i // 2) % len(margins)]
                 try:
                     square = val[0]
                 except TypeError:
@@ -2952,90 +3326,86 @@ class Boxes:
                 else:
                     nborders.append(val)
 
-        borders = nborders
-        for i in range(len(borders)):
-            if i % 2:
-                try:
-                    a, r = borders[i]
-                except TypeError:
-                    angle = (angle + borders[i]) % 360
-                    continue
-                if a > 0:
-                    centerx = posx + r * math.cos(math.radians(angle + 90))
-                    centery = posy + r * math.sin(math.radians(angle + 90))
-                else:
-                    centerx = posx + r * math.cos(math.radians(angle - 90))
-                    centery = posy + r * math.sin(math.radians(angle - 90))
-
-                for direction in (0, 90, 180, 270):
-                    if a > 0 and angle <= direction and (angle + a) % 360 >= direction:
-                        direction -= 90
-                    elif (
-                        a < 0 and angle >= direction and (angle + a) % 360 <= direction
-                    ):
-                        direction -= 90
-                    else:
-                        continue
-                    checkpoint(
-                        ext,
-                        centerx + r * math.cos(math.radians(direction)),
-                        centery + r * math.sin(math.radians(direction)),
-                    )
-                    # print("%4s %4s %4s %f %f" % (angle, direction+90, angle+a, centerx + r * math.cos(math.radians(direction)), centery + r * math.sin(math.radians(direction))))
-                angle = (angle + a) % 360
-                if a > 0:
-                    posx = centerx + r * math.cos(math.radians(angle - 90))
-                    posy = centery + r * math.sin(math.radians(angle - 90))
-                else:
-                    posx = centerx + r * math.cos(math.radians(angle + 90))
-                    posy = centery + r * math.sin(math.radians(angle + 90))
-            else:
-                posx += borders[i] * math.cos(math.radians(angle))
-                posy += borders[i] * math.sin(math.radians(angle))
-            checkpoint(ext, posx, posy)
-
-        return ext
+        for length, turn in zip_longest(nborders[::2], nborders[1::2]):
+            # zero length steps of the margin outline don't move
+            if length:
+                rad = radians(angle)
+                posx += length * cos(rad)
+                posy += length * sin(rad)
+                xs.append(posx)
+                ys.append(posy)
+            if turn is None:  # odd number of borders
+                break
+            try:
+                a, r = turn
+            except TypeError:
+                angle = (angle + turn) % 360
+                continue
+            # radius signed by the turn direction, center is to the side
+            rs = r if a > 0 else -r
+            rad = radians(angle)
+            centerx = posx - rs * sin(rad)
+            centery = posy + rs * cos(rad)
+
+            # outermost points of the arc, reached when heading along an axis
+            end = (angle + a) % 360
+            for direction, ux, uy in (
+                (0, 0.0, -1.0),
+                (90, 1.0, 0.0),
+                (180, 0.0, 1.0),
+                (270, -1.0, 0.0),
+            ):
+                if (a > 0 and angle <= direction <= end) or (
+                    a < 0 and end <= direction <= angle
+                ):
+                    xs.append(centerx + r * ux)
+                    ys.append(centery + r * uy)
+            angle = end
+            rad = radians(angle)
+            posx = centerx + rs * sin(rad)
+            posy = centery - rs * cos(rad)
+            xs.append(posx)
+            ys.append(posy)
+
+        return min(xs), min(ys), max(xs), max(ys)
 
     def _closePolygon(self, borders):
         posx, posy = 0, 0
         angle = 0.0
+        cos, sin, radians = math.cos, math.sin, math.radians
 
         if borders and borders[-1] is not None:
             return borders
 
         borders = borders[:-1]
 
-        for i in range(len(borders)):
-            if i % 2:
-                try:
-                    a, r = borders[i]
-                except TypeError:
-                    angle = (angle + borders[i]) % 360
-                    continue
-                if a > 0:
-                    centerx = posx + r * math.cos(math.radians(angle + 90))
-                    centery = posy + r * math.sin(math.radians(angle + 90))
-                else:
-                    centerx = posx + r * math.cos(math.radians(angle - 90))
-                    centery = posy + r * math.sin(math.radians(angle - 90))
-
-                angle = (angle + a) % 360
-                if a > 0:
-                    posx = centerx + r * math.cos(math.radians(angle - 90))
-                    posy = centery + r * math.sin(math.radians(angle - 90))
-                else:
-                    posx = centerx + r * math.cos(math.radians(angle + 90))
-                    posy = centery + r * math.sin(math.radians(angle + 90))
-            else:
-                posx += borders[i] * math.cos(math.radians(angle))
-                posy += borders[i] * math.sin(math.radians(angle))
+        for length, turn in zip_longest(borders[::2], borders[1::2]):
+            rad = radians(angle)
+            posx += length * cos(rad)
+            posy += length * sin(rad)
+            if turn is None:  # odd number of borders
+                break
+            try:
+                a, r = turn
+            except TypeError:
+                angle = (angle + turn) % 360
+                continue
+            rs = r if a > 0 else -r
+            rad = radians(angle)
+            centerx = posx - rs * sin(rad)
+            centery = posy + rs * cos(rad)
+
+            angle = (angle + a) % 360
+            rad = radians(angle)
+            posx = centerx + rs * sin(rad)
+            posy = centery - rs * cos(rad)
         if len(borders) % 2 == 0:
             borders.append(0.0)
 
         a = math.degrees(math.atan2(-posy, -posx))
         # print(a, angle, a - angle)
         borders.append((a - angle + 360) % 360)
-        borders.append((posx**2 + posy**2) ** 0.5)
+        borders.append(math.hypot(posx, posy))
         borders.append(-a)
         # print(borders)
         return borders
@@ -3063,10 +3433,10 @@ class Boxes:
 
         borders is alternating between length of the edge and angle of the corner. For now neither tabs nor radii are supported. None at the end closes the polygon.
         """
-        try:
-            edges = [self.edges.get(e, e) for e in edge]
-        except TypeError:
-            edges = [self.edges.get(edge, edge)]
+        if callable(edge):  # a single edge object
+            edges = [edge]
+        else:
+            edges = self._resolve_edges(edge)
 
         t = self.thickness  # XXX edge.margin()
 
@@ -3082,26 +3452,33 @@ class Boxes:
 
             self.moveTo(-minx, -miny)
 
-        length_correction = 0.0
-        for i in range(0, len(borders), 2):
-            self.cc(callback, i // 2)
-            self.edge(length_correction)
-            square = borders[i] - length_correction
-            next_angle = borders[i + 1]
+        cc, plain_edge, corner = self.cc, self.edge, self.corner
+        angles = borders[1::2]
+        if correct_corners:
+            # sides are shortened by this on both ends of inner corners
+            tan, radians = math.tan, math.radians
+            corrections = [
+                t * tan(radians(-a / 2))
+                if isinstance(a, (int, float)) and a < 0
+                else 0.0
+                for a in angles
+            ]
+        else:
+            corrections = [0.0] * len(angles)
+        edge_cycle = cycle(edges)
 
-            if (
-                correct_corners
-                and isinstance(next_angle, (int, float))
-                and next_angle < 0
-            ):
-                length_correction = t * math.tan(math.radians(-next_angle / 2))
-            else:
-                length_correction = 0.0
+        length_correction = 0.0
+        for nr, (length, next_angle, correction) in enumerate(
+            zip(borders[::2], angles, corrections)
+        ):
+            cc(callback, nr)
+            plain_edge(length_correction)
+            square = length - length_correction
+            length_correction = correction
             square -= length_correction
-            edge = edges[(i // 2) % len(edges)]
-            edge(square)
-            self.edge(length_correction)
-            self.corner(next_angle, tabs=1)
+            next(edge_cycle)(square)
+            plain_edge(length_correction)
+            corner(next_angle, tabs=1)
 
         if not turtle:
             self.move(tw, th, move, label=label)
@@ -3112,13 +3489,13 @@ class Boxes:
             return
 
         borders = self._closePolygon(borders)
-        bottom = self.edges.get(bottom, bottom)
-        top = self.edges.get(top, top)
+        bottom = self._resolve_edge(bottom)
+        top = self._resolve_edge(top)
         t = self.thickness  # XXX edge.margin()
 
-        leftsettings = copy.deepcopy(self.edges["f"].settings)
+        leftsettings = self.edges["f"].settings.clone()
         lf, lF, lh = leftsettings.edgeObjects(self, add=False)
-        rightsettings = copy.deepcopy(self.edges["f"].settings)
+        rightsettings = self.edges["f"].settings.clone()
         rf, rF, rh = rightsettings.edgeObjects(self, add=False)
 
         length_correction = 0.0
@@ -3180,7 +3557,8 @@ class Boxes:
 
                 top_edges.reverse()
                 top_lengths.reverse()
-                edges.CompoundEdge(self, top_edges, top_lengths)(sum(top_lengths))
+                top_edge = edges.CompoundEdge(self, top_edges, top_lengths)
+                top_edge(top_edge.length)
                 self.edgeCorner(top, left, 90)
                 left(h)
                 self.edgeCorner(left, bottom, 90)
@@ -3216,16 +3594,34 @@ class Boxes:
             move = ""
         move = move.split()
 
+        def skip(direction, count):
+            """move over count parts without drawing them"""
+            kwargs["move"] = direction + " only"
+            self._onlyMoveSize = None
+            part(*args, **kwargs)
+            size = self._onlyMoveSize
+            if not size:  # part does not use a single .move()
+                for i in range(count - 1):
+                    part(*args, **kwargs)
+                return
+            x, y = size
+            if count == 1:
+                return
+            if direction == "left":
+                self.moveTo(-x * (count - 1), 0)
+            elif direction == "right":
+                self.moveTo(x * (count - 1), 0)
+            elif direction == "down":
+                self.moveTo(0, -y * (count - 1))
+            else:
+                self.moveTo(0, y * (count - 1))
+
         # move down / left before
         for m in move:
             if m == "left":
-                kwargs["move"] = "left only"
-                for i in range(width):
-                    part(*args, **kwargs)
+                skip("left", width)
             if m == "down":
-                kwargs["move"] = "down only"
-                for i in range(rows):
-                    part(*args, **kwargs)
+                skip("down", rows)
         # draw matrix
         for i in range(rows):
             with self.saved_context():
@@ -3241,15 +3637,11 @@ class Boxes:
 
         # Move back down
         if "up" not in move:
-            kwargs["move"] = "down only"
-            for i in range(rows):
-                part(*args, **kwargs)
+            skip("down", rows)
 
         # Move right
         if "right" in move:
-            kwargs["move"] = "right only"
-            for i in range(width):
-                part(*args, **kwargs)
+            skip("right", width)
 
     def mirrorX(self, f, offset=0.0):
         """Wrap a function to draw mirrored at the y axis
@@ -1,17 +1,12 @@
 from boxes import Boxes, argparseSections, ArgparseEdgeType
 from typing import Union, List
 
-nema_sizes = {
-    #    motor,flange, holes, screws
-    8: (20.3, 16, 15.4, 3),
-    11: (28.2, 22, 23, 4),
-    14: (35.2, 22, 26, 4),
-    16: (39.2, 22, 31, 4),
-    17: (42.2, 22, 31, 4),
-    23: (56.4, 38.1, 47.1, 5.2),
-    24: (60, 36, 49.8, 5.1),
-    34: (86.3, 73, 69.8, 6.6),
-    42: (110, 55.5, 89, 8.5),
+# same table as used by Boxes.NEMA()
+nema_sizes = Boxes.nema_sizes
+
+_EDGE_TYPES = {
+    "bottom_edge": ArgparseEdgeType("Fhse"),
+    "top_edge": ArgparseEdgeType("efFhcESŠikvLtGyY"),
 }
 
 
@@ -71,10 +66,10 @@ class DefaultBoxes(Boxes):
             if isinstance(default, str):
                 result = argparseSections(default)
                 setattr(self, key, result)
-        for key, arg in {"bottom_edge": "Fhse", "top_edge": "efFhcESŠikvLtGyY"}.items():
+        for key, edge_type in _EDGE_TYPES.items():
             default = getattr(self, key)
-            if isinstance(getattr(self, key), str):
-                result = ArgparseEdgeType(arg)(default)
+            if isinstance(default, str):
+                result = edge_type(default)
                 setattr(self, key, result)
         if nema_mount not in nema_sizes:
             raise Exception(
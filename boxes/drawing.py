@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import math
 from typing import Any
 from xml.etree import ElementTree as ET
 
-from affine import Affine
+from affine import Affine, cos_sin_deg
 
 from boxes.extents import Extents
 
 EPS = 1e-4
 PADDING = 10
+# Arcs get approximated by a single Bézier curve. Larger arcs are split
+# into pieces of at most ARC_STEP
+ARC_MAX = math.radians(100)
+ARC_STEP = math.pi / 5
 
 RANDOMIZE_COLORS = False  # enable to ease check for continuity of paths
 
@@ -32,6 +37,12 @@ def points_equal(x1, y1, x2, y2):
     return abs(x1 - x2) < EPS and abs(y1 - y2) < EPS
 
 
+def svg_number(v) -> str:
+    """Format a coordinate with 0.001 precision and no trailing zeros"""
+    s = f"{v:.3f}".rstrip("0").rstrip(".")
+    return "0" if s == "-0" else s
+
+
 def pdiff(p1, p2):
     x1, y1 = p1
     x2, y2 = p2
@@ -85,6 +96,37 @@ class Surface:
         for p in self.parts:
             p.transform(f, m, invert_y)
 
+    @staticmethod
+    def _travel(parts):
+        """Sum of the jumps between consecutive parts, starting at 0, 0"""
+        x, y = 0.0, 0.0
+        travel = 0.0
+        for part in parts:
+            x0, y0 = part.pathes[0].path[0][1:3]
+            travel += math.hypot(x0 - x, y0 - y)
+            x, y = part.pathes[-1].path[-1][1:3]
+        return travel
+
+    def reorder_parts(self):
+        """Order the parts greedily so each one starts close to where the
+        previous one ended. The cuts within a part are left untouched.
+        The original order is kept unless the new one is shorter."""
+        parts = [p for p in self.parts if p.pathes]
+        ordered = []
+        remaining = parts[:]
+        x, y = 0.0, 0.0
+        while remaining:
+            i = min(
+                range(len(remaining)),
+                key=lambda i: (remaining[i].pathes[0].path[0][1] - x) ** 2
+                + (remaining[i].pathes[0].path[0][2] - y) ** 2,
+            )
+            part = remaining.pop(i)
+            ordered.append(part)
+            x, y = part.pathes[-1].path[-1][1:3]
+        if self._travel(ordered) < self._travel(parts):
+            self.parts = ordered
+
     def new_part(self, name="part"):
         if self.parts and len(self.parts[-1].pathes) == 0:
             return self._p
@@ -230,6 +272,19 @@ class Path:
             self.path = [p for n, p in enumerate(self.path) if p != self.path[n - 1]]
 
 
+class _ShapeRecorder:
+    """Stands in for a surface while Context.add_shape() records a path"""
+
+    def __init__(self) -> None:
+        self.path: list[Any] = []
+
+    def append(self, *path):
+        self.path.append(path)
+
+    def move_to(self, *xy):
+        self.path.append(("M", *xy))
+
+
 class Context:
     def __init__(self, surface, *al, **ad) -> None:
         self._renderer = self._dwg = surface
@@ -241,11 +296,18 @@ class Context:
         self._m = Affine.translation(0, 0)
         self._xy = (0, 0)
         self._mxy = self._m * self._xy
+        # end point of the path segment last appended to the surface
+        # (None if the path got interrupted)
+        self._pen = None
+        # anything sent to the surface since the last stroke?
+        self._path_pending = False
         self._lw = 0
         self._rgb = (0, 0, 0)
         self._ff = "sans-serif"
         self._fs = 10
         self._last_path = None
+        # path segments of shapes in local coordinates, see add_shape()
+        self._shapes: dict[Any, list[Any]] = {}
 
     def _update_bounds_(self, mx, my):
         self._bounds.update(mx, my)
@@ -268,15 +330,42 @@ class Context:
 
     ## transformations
 
+    # translate() and rotate() are called for every single edge and corner.
+    # Fold them into the current matrix directly instead of building a
+    # transformation and doing a full matrix multiplication each time.
+
     def translate(self, x, y):
-        self._m *= Affine.translation(x, y)
+        if x == 0 and y == 0:
+            self._xy = (0, 0)
+            return
+        a, b, c, d, e, f = self._m[:6]
+        self._m = tuple.__new__(
+            Affine, (a, b, a * x + b * y + c, d, e, d * x + e * y + f, 0.0, 0.0, 1.0)
+        )
         self._xy = (0, 0)
 
     def scale(self, sx, sy):
         self._m *= Affine.scale(sx, sy)
 
     def rotate(self, r):
-        self._m *= Affine.rotation(180 * r / math.pi)
+        if r == 0:
+            return
+        ca, sa = cos_sin_deg(180 * r / math.pi)
+        a, b, c, d, e, f = self._m[:6]
+        self._m = tuple.__new__(
+            Affine,
+            (
+                a * ca + b * sa,
+                b * ca - a * sa,
+                c,
+                d * ca + e * sa,
+                e * ca - d * sa,
+                f,
+                0.0,
+                0.0,
+                1.0,
+            ),
+        )
 
     def set_line_width(self, lw):
         self._lw = lw
@@ -293,9 +382,14 @@ class Context:
         x2, y2 = self._mxy = self._m * self._xy
         if not points_equal(x1, y1, x2, y2):
             self._dwg.append("L", x2, y2)
+            self._pen = self._mxy
 
     def _add_move(self):
-        self._dwg.move_to(*self._mxy)
+        # Continuing right where the last segment ended is a no-op for
+        # the surface, so don't bother it
+        if self._mxy != self._pen:
+            self._dwg.move_to(*self._mxy)
+            self._path_pending = True
 
     def move_to(self, x, y):
         self._xy = (x, y)
@@ -304,9 +398,42 @@ class Context:
     def line_to(self, x, y):
         self._line_to(x, y)
 
+    def add_polyline(self, points, close=False):
+        """Move to the first point and draw lines through all others
+
+        Same as move_to() followed by line_to() calls but avoids the
+        overhead per point.
+
+        :param points: sequence of (x, y) tuples
+        :param close: draw a line back to the first point
+        """
+        self.move_to(*points[0])
+        if close:
+            points = itertools.chain(points[1:], points[:1])
+        else:
+            points = points[1:]
+        m = self._m
+        dwg = self._dwg
+        for xy in points:
+            self._add_move()
+            x1, y1 = self._mxy
+            self._xy = xy = tuple(xy)
+            x2, y2 = self._mxy = m * xy
+            if not points_equal(x1, y1, x2, y2):
+                dwg.append("L", x2, y2)
+                self._pen = self._mxy
+
     def _arc(self, xc, yc, radius, angle1, angle2, direction):
         if abs(angle1 - angle2) < EPS or radius < EPS:
             return
+        if abs(angle2 - angle1) > ARC_MAX + EPS:
+            steps = math.ceil(abs(angle2 - angle1) / ARC_STEP - 1e-9)
+            da = (angle2 - angle1) / steps
+            a = angle1
+            for i in range(steps):
+                self._arc(xc, yc, radius, a, a + da, direction)
+                a += da
+            return
         x1, y1 = radius * math.cos(angle1) + xc, radius * math.sin(angle1) + yc
         x4, y4 = radius * math.cos(angle2) + xc, radius * math.sin(angle2) + yc
 
@@ -324,16 +451,78 @@ class Context:
         x3 = xc + bx + k2 * by
         y3 = yc + by - k2 * bx
 
-        mx1, my1 = self._m * (x1, y1)
-        mx2, my2 = self._m * (x2, y2)
-        mx3, my3 = self._m * (x3, y3)
-        mx4, my4 = self._m * (x4, y4)
-        mxc, myc = self._m * (xc, yc)
+        # the arc starts at the current point so only the control points
+        # and the end point need transforming
+        a, b, c, d, e, f = self._m[:6]
+        mx4, my4 = x4 * a + y4 * b + c, x4 * d + y4 * e + f
 
         self._add_move()
-        self._dwg.append("C", mx4, my4, mx2, my2, mx3, my3)
+        self._dwg.append(
+            "C",
+            mx4,
+            my4,
+            x2 * a + y2 * b + c,
+            x2 * d + y2 * e + f,
+            x3 * a + y3 * b + c,
+            x3 * d + y3 * e + f,
+        )
         self._xy = (x4, y4)
-        self._mxy = (mx4, my4)
+        self._mxy = self._pen = (mx4, my4)
+
+    def add_shape(self, key, draw):
+        """Add the path drawn by draw() at the current position
+
+        The path segments are recorded in local coordinates the first
+        time a key is seen. Later calls with the same key only transform
+        the recorded segments instead of calling draw() again.
+
+        :param key: hashable describing the shape completely
+        :param draw: callable drawing the shape at the origin
+        """
+        path = self._shapes.get(key)
+        if path is None:
+            path = self._shapes[key] = self._record(draw)
+        a, b, c, d, e, f = self._m[:6]
+        dwg = self._dwg
+        pen = self._pen
+        for segment in path:
+            C, x, y = segment[:3]
+            xy = (x * a + y * b + c, x * d + y * e + f)
+            if C == "M":
+                if xy != pen:
+                    dwg.move_to(*xy)
+                    self._path_pending = True
+                continue
+            if C == "C":
+                x2, y2, x3, y3 = segment[3:]
+                dwg.append(
+                    "C",
+                    *xy,
+                    x2 * a + y2 * b + c,
+                    x2 * d + y2 * e + f,
+                    x3 * a + y3 * b + c,
+                    x3 * d + y3 * e + f,
+                )
+            else:
+                dwg.append(C, *xy)
+            pen = xy
+        self._pen = pen
+        if path:
+            self._mxy = xy
+
+    def _record(self, draw):
+        # run draw() with identity transformation and a surface that just
+        # collects the path segments
+        stack = (self._m, self._xy, self._mxy, self._pen, self._dwg)
+        self._m = Affine.identity()
+        self._xy = self._mxy = (0, 0)
+        self._pen = None
+        self._dwg = recorder = _ShapeRecorder()
+        try:
+            draw()
+        finally:
+            self._m, self._xy, self._mxy, self._pen, self._dwg = stack
+        return recorder.path
 
     def arc(self, xc, yc, radius, angle1, angle2):
         self._arc(xc, yc, radius, angle1, angle2, 1)
@@ -349,11 +538,16 @@ class Context:
         self._add_move()
         self._dwg.append("C", mx3, my3, mx1, my1, mx2, my2)  # destination first!
         self._xy = (x3, y3)
-        self._mxy = (mx3, my3)
+        self._mxy = self._pen = (mx3, my3)
 
     def stroke(self):
-        self._last_path = self._dwg.stroke(rgb=self._rgb, lw=self._lw)
+        if self._path_pending:
+            self._last_path = self._dwg.stroke(rgb=self._rgb, lw=self._lw)
+            self._path_pending = False
+        else:  # nothing to stroke
+            self._last_path = None
         self._xy = (0, 0)
+        self._pen = None
 
     def fill(self):
         self._xy = (0, 0)
@@ -373,6 +567,8 @@ class Context:
         mx0, my0 = self._m * self._xy
         m = self._m
         self._dwg.append("T", mx0, my0, m, text, params)
+        self._pen = None
+        self._path_pending = True
 
     def text_extents(self, text):
         fs = self._fs
@@ -401,6 +597,7 @@ class Context:
     ## additional methods
     def new_part(self):
         self._dwg.new_part()
+        self._pen = None
 
 
 class SVGSurface(Surface):
@@ -525,6 +722,7 @@ Creation date: {date}
 
         self._add_metadata(svg)
 
+        num = svg_number
         for i, part in enumerate(self.parts):
             if not part.pathes:
                 continue
@@ -549,18 +747,18 @@ Creation date: {date}
                         if start and points_equal(start[1], start[2], last[1], last[2]):
                             p.append("Z")
                         start = c
-                        p.append(f"M {x:.3f} {y:.3f}")
+                        p.append(f"M {num(x)} {num(y)}")
                     elif C == "L":
                         if abs(x - x0) < EPS:
-                            p.append(f"V {y:.3f}")
+                            p.append(f"V {num(y)}")
                         elif abs(y - y0) < EPS:
-                            p.append(f"H {x:.3f}")
+                            p.append(f"H {num(x)}")
                         else:
-                            p.append(f"L {x:.3f} {y:.3f}")
+                            p.append(f"L {num(x)} {num(y)}")
                     elif C == "C":
                         x1, y1, x2, y2 = c[3:]
                         p.append(
-                            f"C {x1:.3f} {y1:.3f} {x2:.3f} {y2:.3f} {x:.3f} {y:.3f}"
+                            f"C {num(x1)} {num(y1)} {num(x2)} {num(y2)} {num(x)} {num(y)}"
                         )
                     elif C == "T":
                         m, text, params = c[3:]
@@ -301,6 +301,18 @@ class Settings:
         """
         pass
 
+    def clone(self):
+        """
+        Return an independent copy that can be changed with .setValues()
+
+        Values are plain bool, int, float or str so a shallow copy of the
+        values dict is enough - much cheaper than copy.deepcopy().
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.values = dict(self.values)
+        return new
+
     def __getattr__(self, name):
         if "values" in self.__dict__ and name in self.values:
             return self.values[name]
@@ -1133,16 +1145,23 @@ class FingerHoles(FingerJointBase):
                     length - 2 * b,
                     self.settings.width - 2 * b,
                 )
-            for i in range(fingers):
-                pos = leftover / 2.0 + i * (s + f)
-
-                if bedBolts and bedBolts.drawBolt(i):
+            if not fingers:
+                return
+            positions = [leftover / 2.0 + i * (s + f) for i in range(fingers)]
+            if bedBolts:
+                bolts = [
+                    (pos - 0.5 * s, 0)
+                    for i, pos in enumerate(positions)
+                    if bedBolts.drawBolt(i)
+                ]
+                if bolts:
                     d = (bedBoltSettings or self.boxes.bedBoltSettings)[0]
-                    self.boxes.hole(pos - 0.5 * s, 0, d * 0.5)
-
-                self.boxes.rectangularHole(
-                    pos + 0.5 * f, 0, f + p, self.settings.width + p
-                )
+                    self.boxes.holes(bolts, d * 0.5)
+            self.boxes.rectangularHoles(
+                [(pos + 0.5 * f, 0) for pos in positions],
+                f + p,
+                self.settings.width + p,
+            )
 
 
 class FingerHoleEdge(BaseEdge):
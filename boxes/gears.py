@@ -257,6 +257,10 @@ class OptionParser(argparse.ArgumentParser):
 
 class Gears():
 
+    # The option parser does not depend on the instance. Building it is
+    # expensive and every Boxes object creates Gears objects, so share it.
+    _sharedOptionParser: "OptionParser | None" = None
+
     def __init__(self, boxes, **kw) -> None:
         # an alternate way to get debug info:
         # could use inkex.debug(string) instead...
@@ -267,6 +271,11 @@ class Gears():
         #    # print >>self.tty, "gears-dev " + __version__
 
         self.boxes = boxes
+        if Gears._sharedOptionParser is None:
+            Gears._sharedOptionParser = self._buildOptionParser()
+        self.OptionParser = Gears._sharedOptionParser
+
+    def _buildOptionParser(self) -> OptionParser:
         self.OptionParser = OptionParser()
         self.OptionParser.add_option("-t", "--teeth",
                                      action="store", type="int",
@@ -383,6 +392,7 @@ class Gears():
                                      action="store", type="inkbool", 
                                      dest="undercut_alert", default=False,
                                      help="Let the user confirm a warning dialog if undercut occurs. This dialog also shows helpful hints against undercut")
+        return self.OptionParser
 
     def calc_circular_pitch(self):
         """We use math based on circular pitch."""
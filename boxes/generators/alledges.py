@@ -90,23 +90,27 @@ class AllEdges(DefaultBoxes):
         x = self.x
         t = self.thickness
 
-        chars = list(self.edges.keys())
-        chars.sort(key=lambda c: c.lower() + (c if c.isupper() else ""))
-        chars.reverse()
+        # lower case first, each followed by its upper case variant
+        keys = [(c.lower() + (c if c.isupper() else ""), c) for c in self.edges]
+        keys.sort(reverse=True)
+        chars = [c for _, c in keys]
+
+        h, text_gap, gap = 4 * t, 3 * t, 12 * t
 
         self.moveTo(0, 10 * t)
 
         for c in chars:
+            edge = self.edges[c]
             with self.saved_context():
                 self.move(0, 0, "", True)
                 self.moveTo(x, 0, 90)
-                self.edge(t + self.edges[c].startwidth())
+                self.edge(t + edge.startwidth())
                 self.corner(90)
-                self.edges[c](x, h=4 * t)
+                edge(x, h=h)
                 self.corner(90)
-                self.edge(t + self.edges[c].endwidth())
+                self.edge(t + edge.endwidth())
                 self.move(0, 0, "")
 
-            self.moveTo(0, 3 * t + self.edges[c].spacing())
-            self.text(f"{c} - {self.edges[c].description}")
-            self.moveTo(0, 12 * t)
+            self.moveTo(0, text_gap + edge.spacing())
+            self.text(f"{c} - {edge.description}")
+            self.moveTo(0, gap)
@@ -17,7 +17,6 @@ from typing import List
 from boxes.default_box import DefaultBoxes
 from boxes import edges
 from boxes.edges import Settings
-import copy
 from boxes.utils import edge_init
 
 
@@ -102,21 +101,27 @@ class AngledBox(DefaultBoxes):
 
         self.moveTo((tx - lx) / 2.0, edge.margin())
 
+        angle = 360.0 / (2 * n + 2)
+
         if hole:
-            with self.saved_context():
-                hr, hh, hside = self.regularPolygon(2 * n + 2, h=y / 2.0 - t)
-                dx = side - hside
-                hlx = lx - dx
-
-                self.moveTo(dx / 2.0, t + edge.spacing())
-                for i, l in enumerate(([hlx] + ([hside] * n)) * 2):
-                    self.edge(l)
-                    self.corner(360.0 / (2 * n + 2))
-
-        for i, l in enumerate(([lx] + ([side] * n)) * 2):
-            self.cc(callback, i, 0, edge.startwidth() + self.burn)
+            self.ctx.save()
+            hr, hh, hside = self.regularPolygon(2 * n + 2, h=y / 2.0 - t)
+            dx = side - hside
+            hlx = lx - dx
+
+            self.moveTo(dx / 2.0, t + edge.spacing())
+            plain_edge, corner = self.edge, self.corner
+            for l in ((hlx,) + (hside,) * n) * 2:
+                plain_edge(l)
+                corner(angle)
+            self.ctx.restore()
+
+        cc, edgeCorner = self.cc, self.edgeCorner
+        cc_y = edge.startwidth() + self.burn
+        for i, l in enumerate(((lx,) + (side,) * n) * 2):
+            cc(callback, i, 0, cc_y)
             edge(l)
-            self.edgeCorner(edge, edge, 360.0 / (2 * n + 2))
+            edgeCorner(edge, edge, angle)
 
         self.move(tx, ty, move, label=label)
 
@@ -147,7 +152,7 @@ class AngledBox(DefaultBoxes):
         else:
             lx = x - 2 * r + side
 
-        fingerJointSettings = copy.deepcopy(self.edges["f"].settings)
+        fingerJointSettings = self.edges["f"].settings.clone()
         fingerJointSettings.setValues(self.thickness, angle=360.0 / (2 * (n + 1)))
         fingerJointSettings.edgeObjects(self, chars="gGH")
 
@@ -166,41 +171,28 @@ class AngledBox(DefaultBoxes):
         self.floor(x, y, n, edge="F", move="up only")
 
         fingers = self.top in ("angled lid2", "angled hole")
+        t = "f" if fingers else "e"
+        # wall edges with the angled finger joints facing in and out
+        walls = (b + "g" + t + "g", b + "G" + t + "G")
 
         cnt = 0
         for j in range(2):
             cnt += 1
-            if j == 0 or n % 2:
-                self.rectangularWall(
-                    lx,
-                    h,
-                    move="right",
-                    edges=b + "GfG" if fingers else b + "GeG",
-                    label=f"wall {cnt}",
-                )
-            else:
+            self.rectangularWall(
+                lx,
+                h,
+                move="right",
+                edges=walls[1 if j == 0 or n % 2 else 0],
+                label=f"wall {cnt}",
+            )
+            # reverse for second half if even n
+            flip = j * ((n + 1) % 2)
+            for i in range(n):
+                cnt += 1
                 self.rectangularWall(
-                    lx,
+                    side,
                     h,
                     move="right",
-                    edges=b + "gfg" if fingers else b + "geg",
+                    edges=walls[(i + flip) % 2],
                     label=f"wall {cnt}",
                 )
-            for i in range(n):
-                cnt += 1
-                if (i + j * ((n + 1) % 2)) % 2:  # reverse for second half if even n
-                    self.rectangularWall(
-                        side,
-                        h,
-                        move="right",
-                        edges=b + "GfG" if fingers else b + "GeG",
-                        label=f"wall {cnt}",
-                    )
-                else:
-                    self.rectangularWall(
-                        side,
-                        h,
-                        move="right",
-                        edges=b + "gfg" if fingers else b + "geg",
-                        label=f"wall {cnt}",
-                    )
@@ -17,6 +17,7 @@ from typing import List
 from boxes.default_box import DefaultBoxes
 from boxes import edges
 import math
+from functools import partial
 from boxes.utils import edge_init
 
 
@@ -83,10 +84,11 @@ class AngledCutJig(DefaultBoxes):  # Change class name!
 
     def bottomCB(self):
         t = self.thickness
-        self.fingerHolesAt(10 - t, 4.5 * t, 20, 0)
-        self.fingerHolesAt(30 + t, 4.5 * t, self.x, 0)
-        self.fingerHolesAt(10 - t, self.y - 4.5 * t, 20, 0)
-        self.fingerHolesAt(30 + t, self.y - 4.5 * t, self.x, 0)
+        y1, y2 = 4.5 * t, self.y - 4.5 * t
+        self.fingerHolesAt(10 - t, y1, 20, 0)
+        self.fingerHolesAt(30 + t, y1, self.x, 0)
+        self.fingerHolesAt(10 - t, y2, 20, 0)
+        self.fingerHolesAt(30 + t, y2, self.x, 0)
 
     def render(self):
         # adjust to the variables you want in the local scope
@@ -94,33 +96,16 @@ class AngledCutJig(DefaultBoxes):  # Change class name!
         t = self.thickness
 
         th = x * math.tan(math.radians(90 - self.angle))
-        l = (x**2 + th**2) ** 0.5
+        l = math.hypot(x, th)
         th2 = 20 * math.tan(math.radians(self.angle))
-        l2 = (20**2 + th2**2) ** 0.5
+        l2 = math.hypot(20, th2)
 
         self.rectangularWall(30 + x + 2 * t, y, callback=[self.bottomCB], move="right")
-        self.rectangularWall(
-            l,
-            y,
-            callback=[
-                lambda: self.fingerHolesAt(0, 4.5 * t, l, 0),
-                None,
-                lambda: self.fingerHolesAt(0, 4.5 * t, l, 0),
-                None,
-            ],
-            move="right",
-        )
-        self.rectangularWall(
-            l2,
-            y,
-            callback=[
-                lambda: self.fingerHolesAt(0, 4.5 * t, l2, 0),
-                None,
-                lambda: self.fingerHolesAt(0, 4.5 * t, l2, 0),
-                None,
-            ],
-            move="right",
-        )
+        for length in (l, l2):
+            holes = partial(self.fingerHolesAt, 0, 4.5 * t, length, 0)
+            self.rectangularWall(
+                length, y, callback=[holes, None, holes, None], move="right"
+            )
 
         self.rectangularTriangle(x, th, "fef", num=2, move="up")
         self.rectangularTriangle(20, th2, "fef", num=2, move="up")
@@ -19,6 +19,11 @@ from boxes.default_box import DefaultBoxes
 from boxes import edges
 from boxes.utils import edge_init
 
+# the keyboard is tilted by 15 degrees
+_SIN15 = math.sin(math.radians(15))
+_COS15 = math.cos(math.radians(15))
+_TAN15 = math.tan(math.radians(15))
+
 
 class Arcade(DefaultBoxes):
     """Desktop Arcade Machine"""
@@ -87,16 +92,17 @@ class Arcade(DefaultBoxes):
         y, h = self.y, self.h
         t = self.thickness
         r = 10
-        d_30 = 2 * r * math.tan(math.radians(15))
+        d_30 = 2 * r * _TAN15
+        front_x = (self.front + t) * _SIN15
 
         tw, th = (
-            y + 2 * r + (self.front + t) * math.sin(math.radians(15)),
+            y + 2 * r + front_x,
             h + 2 * r + (self.topback + t) / 2**0.5,
         )
         if self.move(tw, th, move, True):
             return
 
-        self.moveTo(r + (self.front + t) * math.sin(math.radians(15)), 0)
+        self.moveTo(r + front_x, 0)
 
         with self.saved_context():
             self.moveTo(0, r)
@@ -168,13 +174,13 @@ class Arcade(DefaultBoxes):
         y, h = self.y, self.h = 540, 450
         y = self.y = (
             (self.topback + self.top + 3 * t - 100 + self.monitor_height) / 2**0.5
-            + (self.keyboard_depth + 2 * t) * math.cos(math.radians(15))
-            - (self.front + t) * math.sin(math.radians(15))
+            + (self.keyboard_depth + 2 * t) * _COS15
+            - (self.front + t) * _SIN15
         )
         h = self.h = (
             (self.monitor_height - self.topback + self.top + 1 * t + 100) / 2**0.5
-            + +(self.keyboard_depth + 2 * t) * math.sin(math.radians(15))
-            + (self.front + t) * math.cos(math.radians(15))
+            + +(self.keyboard_depth + 2 * t) * _SIN15
+            + (self.front + t) * _COS15
         )
 
         self.bottom = y - 40 - 0.5 * t
@@ -91,10 +91,11 @@ See ClosedBox for variant without a base.
             y = self.adjustSize(y)
             h = self.adjustSize(h)
 
-        self.rectangularWall(x, h, "fFFF", move="right", label="Wall 1")
-        self.rectangularWall(y, h, "ffFf", move="up", label="Wall 2")
-        self.rectangularWall(y, h, "ffFf", label="Wall 4")
-        self.rectangularWall(x, h, "fFFF", move="left up", label="Wall 3")
+        # the second wall of each pair replays the outline of the first
+        self._cachedRectangularWall(x, h, "fFFF", move="right", label="Wall 1")
+        self._cachedRectangularWall(y, h, "ffFf", move="up", label="Wall 2")
+        self._cachedRectangularWall(y, h, "ffFf", label="Wall 4")
+        self._cachedRectangularWall(x, h, "fFFF", move="left up", label="Wall 3")
 
         self.rectangularWall(x, y, "ffff", move="right", label="Top")
         self.rectangularWall(x, y, "hhhh", label="Base")
@@ -25,6 +25,13 @@ class BayonetBox(DefaultBoxes):
     description = """Glue together - all outside rings to the bottom, all inside rings to the top."""
     ui_group = "Box"
 
+    # unit vectors to the three alignment pins, 120° apart
+    _alignment_directions = (
+        (1.0, 0.0),
+        (-0.5, 0.8660254037844387),
+        (-0.5, -0.8660254037844387),
+    )
+
     def __init__(
         self,
         x: float = 100,
@@ -89,16 +96,14 @@ class BayonetBox(DefaultBoxes):
         r = d / 2
         t = self.thickness
         p = 0.05 * t
-        l = self.lugs
+        r_outer = r - t / 2
+        r_inner = r - 2 * t - p
 
-        a = 180 / l
-        with self.saved_context():
-            for i in range(3):
-                if outer:
-                    self.hole(r - t / 2, 0, d=self.alignment_pins)
-                if inner:
-                    self.hole(r - 2 * t - p, 0, d=self.alignment_pins)
-                self.moveTo(0, 0, 360 / 3)
+        for cx, cy in self._alignment_directions:
+            if outer:
+                self.hole(r_outer * cx, r_outer * cy, d=self.alignment_pins)
+            if inner:
+                self.hole(r_inner * cx, r_inner * cy, d=self.alignment_pins)
 
     def lowerLayer(self, asPart=False, move=None):
         d = self.diameter
@@ -118,21 +123,22 @@ class BayonetBox(DefaultBoxes):
         self.hole(0, 0, r=d / 2 - 2.5 * t)
         self.moveTo(d / 2 - 1.5 * t, 0, -90)
 
-        for i in range(l):
-            self.polyline(
-                0,
-                (-4 / 3 * a, r - 1.5 * t),
-                0,
-                90,
-                0.5 * t,
-                -90,
-                0,
-                (-2 / 3 * a, r - t),
-                0,
-                -90,
-                0.5 * t,
-                90,
-            )
+        # outline of one lug and its gap
+        lug = (
+            0,
+            (-4 / 3 * a, r - 1.5 * t),
+            0,
+            90,
+            0.5 * t,
+            -90,
+            0,
+            (-2 / 3 * a, r - t),
+            0,
+            -90,
+            0.5 * t,
+            90,
+        )
+        self.polyline(*(lug * l))
 
         if asPart:
             self.move(d, d, move)
@@ -151,21 +157,21 @@ class BayonetBox(DefaultBoxes):
             self.lowerLayer()
 
         self.moveTo(d / 2 - 1.5 * t + p, 0, -90)
-        for i in range(l):
-            self.polyline(
-                0,
-                (-2 / 3 * a, r - 1.5 * t + p),
-                0,
-                90,
-                0.5 * t,
-                -90,
-                0,
-                (-4 / 3 * a, r - t + p),
-                0,
-                -90,
-                0.5 * t,
-                90,
-            )
+        lug = (
+            0,
+            (-2 / 3 * a, r - 1.5 * t + p),
+            0,
+            90,
+            0.5 * t,
+            -90,
+            0,
+            (-4 / 3 * a, r - t + p),
+            0,
+            -90,
+            0.5 * t,
+            90,
+        )
+        self.polyline(*(lug * l))
 
     def upperCB(self):
         d = self.diameter
@@ -181,21 +187,21 @@ class BayonetBox(DefaultBoxes):
         self.alignmentHoles(inner=True, outer=True)
         self.moveTo(d / 2 - 1.5 * t, 0, -90)
 
-        for i in range(l):
-            self.polyline(
-                0,
-                (-1.3 * a, r - 1.5 * t + p),
-                0,
-                90,
-                0.5 * t,
-                -90,
-                0,
-                (-0.7 * a, r - t + p),
-                0,
-                -90,
-                0.5 * t,
-                90,
-            )
+        lug = (
+            0,
+            (-1.3 * a, r - 1.5 * t + p),
+            0,
+            90,
+            0.5 * t,
+            -90,
+            0,
+            (-0.7 * a, r - t + p),
+            0,
+            -90,
+            0.5 * t,
+            90,
+        )
+        self.polyline(*(lug * l))
 
     def render(self):
         d = self.diameter
@@ -252,6 +252,16 @@ class Lid:
 
 class _TopEdge(Boxes):
 
+    # edges replacing the top edge for left, back, right, front
+    # None keeps the top edge itself
+    _top_edge_replacements = {
+        "i": ("j", "e", None, "e"),
+        "k": ("e", None, "e", None),
+        "L": ("M", None, "N", "e"),
+        "v": ("e", None, "e", "e"),
+        "t": (None, "e", None, "e"),
+    }
+
     def addTopEdgeSettings(self, fingerjoint={}, stackable={}, hinge={},
                            cabinethinge={}, slideonlid={}, click={},
                            roundedtriangle={}, mounting={}, handle={}):
@@ -269,28 +279,22 @@ class _TopEdge(Boxes):
         """Return top edges belonging to given main edge type
         as a list containing edge for left, back, right, front.
         """
-        tl = tb = tr = tf = self.edges.get(top_edge, self.edges["e"])
-
-        if tl.char == "i":
-            tb = tf = "e"
-            tl = "j"
-        elif tl.char == "k":
-            tl = tr = "e"
-        elif tl.char == "L":
-            tl = "M"
-            tf = "e"
-            tr = "N"
-        elif tl.char == "v":
-            tl = tr = tf = "e"
-        elif tl.char == "t":
-            tf = tb = "e"
-        elif tl.char == "G":
+        edge = self.edges.get(top_edge, self.edges["e"])
+
+        # class attribute - also called unbound by non _TopEdge generators
+        replacements = _TopEdge._top_edge_replacements.get(edge.char)
+        if replacements:
+            return [edge if r is None else r for r in replacements]
+
+        tl = tb = tr = tf = edge
+        if tl.char == "G":
             tl = tb = tr = tf = "e"
-            if self.edges["G"].settings.side == edges.MountingSettings.PARAM_LEFT:
+            side = self.edges["G"].settings.side
+            if side == edges.MountingSettings.PARAM_LEFT:
                 tl = "G"
-            elif self.edges["G"].settings.side == edges.MountingSettings.PARAM_RIGHT:
+            elif side == edges.MountingSettings.PARAM_RIGHT:
                 tr = "G"
-            elif self.edges["G"].settings.side == edges.MountingSettings.PARAM_FRONT:
+            elif side == edges.MountingSettings.PARAM_FRONT:
                 tf = "G"
             else: #PARAM_BACK
                 tb = "G"
@@ -10,6 +10,8 @@ class BoxesQrCodeFactory(qrcode.image.base.BaseImage):
     _SVG_namespace = "http://www.w3.org/2000/svg"
     kind = "SVG"
     allowed_kinds = ("SVG",)
+    # adjacent dark modules are merged and drawn in process()
+    needs_processing = True
 
     def __init__(self, *args, ctx=None, x=0, y=0, **kwargs):
         super().__init__(*args, **kwargs)
@@ -19,8 +21,25 @@ class BoxesQrCodeFactory(qrcode.image.base.BaseImage):
         self.unit_size = self.units(self.box_size)
 
     def drawrect(self, row, col):
-        self.ctx.rectangle(*self._rect(row, col))
-        self._img.append(self._rect(row, col))
+        # modules are passed row by row, extend the current run if possible
+        if self._run and self._run[0] == row and self._run[2] == col:
+            self._run[2] = col + 1
+            return
+        self._drawrun()
+        self._run = [row, col, col + 1]
+
+    def _drawrun(self):
+        if not self._run:
+            return
+        row, col, end = self._run
+        x, y, width, height = self._rect(row, col)
+        rect = (x, y, width, height * (end - col))
+        self.ctx.rectangle(*rect)
+        self._img.append(rect)
+        self._run = None
+
+    def process(self):
+        self._drawrun()
 
     def units(self, pixels, text=True):
         """
@@ -39,6 +58,8 @@ class BoxesQrCodeFactory(qrcode.image.base.BaseImage):
         return f"".join(self._img)
 
     def new_image(self, **kwargs):
+        # dark modules not drawn yet: [row, first col, last col + 1]
+        self._run = None
         self._img = []
         return self._img
 
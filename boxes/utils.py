@@ -1,5 +1,6 @@
 import re
 import argparse
+from functools import lru_cache
 
 from typing import List
 
@@ -14,25 +15,24 @@ def dist(dx: float, dy: float):
     return (dx**2 + dy**2) ** 0.5
 
 
-def argparseSections(s: str, group: int = 3):
-    """
-    Parse sections parameter
+_SECTION_DIVIDED = re.compile(r"^(\d+(\.\d+)?)/(\d+)$")
+_SECTION_REPEATED = re.compile(r"^(\d+(\.\d+)?)\*(\d+)$")
 
-    :param s: string to parse
-    """
 
+@lru_cache(maxsize=256)
+def _parseSections(s: str, group: int):
     result: List[float] = []
 
     s = re.split(r"\s|:", s)
 
     try:
         for part in s:
-            m = re.match(r"^(\d+(\.\d+)?)/(\d+)$", part)
+            m = _SECTION_DIVIDED.match(part)
             if m:
                 n = int(m.group(group))
                 result.extend([float(m.group(1)) / n] * n)
                 continue
-            m = re.match(r"^(\d+(\.\d+)?)\*(\d+)$", part)
+            m = _SECTION_REPEATED.match(part)
             if m:
                 n = int(m.group(group))
                 result.extend([float(m.group(1))] * n)
@@ -45,10 +45,26 @@ def argparseSections(s: str, group: int = 3):
     if not result:
         result.append(0.0)
 
-    return result
+    return tuple(result)
+
+
+def argparseSections(s: str, group: int = 3):
+    """
+    Parse sections parameter
+
+    :param s: string to parse
+    """
+    # parsing is cached, hand out a fresh list each time
+    return list(_parseSections(s, group))
+
+
+@lru_cache(maxsize=None)
+def _settingsArguments(settings):
+    # get_arguments() parses the doc string - do it once per Settings class
+    return tuple(settings.get_arguments())
 
 
 def edge_init(box, list_edges: List):
     for setting in list_edges:
-        for key, arg in setting.get_arguments():
+        for key, arg in _settingsArguments(setting):
             setattr(box, key, arg)
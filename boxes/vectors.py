@@ -95,13 +95,26 @@ def kerf(points, k, closed=True):
     """Outset points by k
     Assumes a closed loop of points
     """
-    result = []
     lp = len(points)
 
-    for i in range(len(points)):
-        # get normalized orthogonals of both segments
-        v1 = vorthogonal(normalize(vdiff(points[i - 1], points[i])))
-        v2 = vorthogonal(normalize(vdiff(points[i], points[(i + 1) % lp])))
+    # normalized orthogonals of all segments, normals[i] is the segment
+    # ending in points[i]. Calculated once instead of twice per point
+    normals = []
+    px, py = points[-1][0], points[-1][1]
+    for p in points:
+        x, y = p[0], p[1]
+        dx, dy = x - px, y - py
+        l = (dx ** 2 + dy ** 2) ** 0.5
+        if l == 0.0:
+            normals.append((-0.0, 0.0))
+        else:
+            normals.append((-(dy / l), dx / l))
+        px, py = x, y
+
+    result = []
+    for i, p in enumerate(points):
+        v1 = normals[i]
+        v2 = normals[(i + 1) % lp]
 
         if not closed:
             if i == 0:
@@ -111,7 +124,8 @@ def kerf(points, k, closed=True):
         # direction the point has to move
         d = normalize(vadd(v1, v2))
         # cos of the half the angle between the segments
-        cos_alpha = dotproduct(v1, d)
-        result.append(vadd(points[i], vscalmul(d, -k / cos_alpha)))
+        cos_alpha = v1[0] * d[0] + v1[1] * d[1]
+        a = -k / cos_alpha
+        result.append((p[0] + a * d[0], p[1] + a * d[1]))
 
     return result
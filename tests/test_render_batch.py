@@ -0,0 +1,15 @@
+import pytest
+
+from boxes import _renderVariant
+from boxes.generators.universalbox import UniversalBox
+
+
+def test_edge_setting_variant_differs_from_default():
+    default = _renderVariant(UniversalBox, {})
+    wide = _renderVariant(UniversalBox, {"FingerJoint_finger": 6.0})
+    assert wide != default
+
+
+def test_unknown_parameter_raises():
+    with pytest.raises(ValueError):
+        _renderVariant(UniversalBox, {"no_such_parameter": 1})